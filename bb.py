@@ -1145,6 +1145,21 @@ class ASTNormalizer(ast.NodeTransformer):
         self.generic_visit(node)
         return node
 
+    # Node type -> visitor, looked up once instead of NodeVisitor.visit's
+    # getattr(self, 'visit_' + class name) on every node
+    _visitors = {
+        ast.Name: visit_Name,
+        ast.arg: visit_arg,
+        ast.FunctionDef: visit_FunctionDef,
+        ast.AsyncFunctionDef: visit_AsyncFunctionDef,
+    }
+
+    def visit(self, node):
+        visitor = self._visitors.get(type(node))
+        if visitor is None:
+            return self.generic_visit(node)
+        return visitor(self, node)
+
 
 def code_collect_names(tree: ast.Module) -> Set[str]:
     """Collect all names (variables, functions) used in the AST"""
@@ -2810,6 +2825,11 @@ def code_extract_dependencies(normalized_code: str) -> List[str]:
     Returns:
         List of actual function hashes (without object_ prefix) that this function depends on
     """
+    # Every dependency is a 'from bb.pool import ...' statement, so code that
+    # never mentions bb.pool has none and does not need to be parsed
+    if 'bb.pool' not in normalized_code:
+        return []
+
     dependencies = []
     tree = ast.parse(normalized_code)
 
@@ -3615,6 +3635,57 @@ def code_add(file_path_with_lang: str, comment: str = ""):
         file_path_with_lang: File path with language suffix (e.g., "file.py@eng")
         comment: Optional comment explaining this mapping variant
     """
+    code_add_many([file_path_with_lang], comment)
+
+
+def code_add_many(files_with_lang: List[str], comment: str = ""):
+    """
+    Add several functions to the bb pool using schema v1.
+
+    Every file is validated and normalized before anything is written, so an
+    invalid file aborts the whole call and leaves the pool untouched. Files are
+    checked in order, so a file may import a function from a file listed
+    earlier in the same call. Files that normalize to the same logic (e.g.
+    translations of one function) write object.json once and only add their
+    language mapping; the hash is still printed once per file.
+
+    Args:
+        files_with_lang: File paths with language suffix (e.g., ["file.py@eng", "fichier.py@fra"])
+        comment: Optional comment explaining these mapping variants
+    """
+    prepared = []
+    pending = set()
+    for file_path_with_lang in files_with_lang:
+        result = code_prepare(file_path_with_lang, pending)
+        prepared.append(result)
+        pending.add(result[0])
+
+    saved = set()
+    for hash_value, lang, normalized_code, docstring, name_mapping, alias_mapping, checks in prepared:
+        if hash_value in saved:
+            print(f"Hash: {hash_value}")
+        else:
+            code_save_v1(hash_value, normalized_code, code_create_metadata(checks=checks))
+            saved.add(hash_value)
+
+        mapping_save_v1(hash_value, lang, docstring, name_mapping, alias_mapping, comment)
+
+
+def code_prepare(file_path_with_lang: str, pending: Set[str] = frozenset()) -> Tuple[str, str, str, str, Dict[str, str], Dict[str, str], List[str]]:
+    """
+    Read, validate and normalize a function file before it is saved.
+
+    Exits with an error message if the argument, the file, or its bb imports
+    and @check targets are invalid.
+
+    Args:
+        file_path_with_lang: File path with language suffix (e.g., "file.py@eng")
+        pending: Hashes that are not in the pool yet but will be saved by the
+            same call, accepted as bb imports and @check targets
+
+    Returns:
+        (hash, lang, normalized_code_without_docstring, docstring, name_mapping, alias_mapping, checks)
+    """
     # Parse the path and language
     if '@' not in file_path_with_lang:
         print("Error: Missing language suffix. Use format: path/to/file.py@lang", file=sys.stderr)
@@ -3664,7 +3735,7 @@ def code_add(file_path_with_lang: str, comment: str = ""):
         missing_deps = []
         for dep_hash, alias in alias_mapping.items():
             dep_dir = pool_dir / dep_hash[:2] / dep_hash[2:]
-            if not (dep_dir / 'object.json').exists():
+            if dep_hash not in pending and not (dep_dir / 'object.json').exists():
                 missing_deps.append((dep_hash, alias))
 
         if missing_deps:
@@ -3679,7 +3750,7 @@ def code_add(file_path_with_lang: str, comment: str = ""):
         missing_checks = []
         for check_hash in checks:
             check_dir = pool_dir / check_hash[:2] / check_hash[2:]
-            if not (check_dir / 'object.json').exists():
+            if check_hash not in pending and not (check_dir / 'object.json').exists():
                 missing_checks.append(check_hash)
 
         if missing_checks:
@@ -3692,8 +3763,7 @@ def code_add(file_path_with_lang: str, comment: str = ""):
     # Compute hash on code WITHOUT docstring (so same logic = same hash regardless of language)
     hash_value = hash_compute(normalized_code_without_docstring)
 
-    # Save to v1 format (docstring stored separately in mapping.json)
-    code_save(hash_value, lang, normalized_code_without_docstring, docstring, name_mapping, alias_mapping, comment, checks=checks)
+    return hash_value, lang, normalized_code_without_docstring, docstring, name_mapping, alias_mapping, checks
 
 
 def code_replace_docstring(code: str, new_docstring: str) -> str:
@@ -5159,9 +5229,9 @@ def command_aston(filepath: str, test_mode: bool = False):
         _, tuples = aston_write(tree)
         reconstructed = aston_read(tuples)
 
-        # Compare using ast.dump
-        original_dump = ast.dump(tree)
-        reconstructed_dump = ast.dump(reconstructed)
+        # Compare using compact ast.dump (positional fields, no locations)
+        original_dump = ast.dump(tree, annotate_fields=False)
+        reconstructed_dump = ast.dump(reconstructed, annotate_fields=False)
 
         if original_dump == reconstructed_dump:
             print("✓ Round-trip test PASSED", file=sys.stderr)
@@ -5169,10 +5239,10 @@ def command_aston(filepath: str, test_mode: bool = False):
         else:
             print("✗ Round-trip test FAILED", file=sys.stderr)
             print("\nOriginal AST:", file=sys.stderr)
-            print(original_dump[:500], file=sys.stderr)
+            print(ast.dump(tree)[:500], file=sys.stderr)
             print("\n...\n", file=sys.stderr)
             print("Reconstructed AST:", file=sys.stderr)
-            print(reconstructed_dump[:500], file=sys.stderr)
+            print(ast.dump(reconstructed)[:500], file=sys.stderr)
             sys.exit(1)
     else:
         # Normal mode - output tuples as JSON lines
@@ -5181,7 +5251,7 @@ def command_aston(filepath: str, test_mode: bool = False):
             print(json.dumps(tup, ensure_ascii=False))
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(description='bb - Function pool manager')
     subparsers = parser.add_subparsers(dest='command', help='Commands')
 
@@ -5196,7 +5266,7 @@ def main():
 
     # Add command
     add_parser = subparsers.add_parser('add', help='Add a function to the pool')
-    add_parser.add_argument('file', help='Path to Python file with @lang suffix (e.g., file.py@eng)')
+    add_parser.add_argument('file', nargs='+', help='Path to Python file with @lang suffix (e.g., file.py@eng)')
     add_parser.add_argument('--comment', default='', help='Optional comment explaining this mapping variant')
 
     # Get command (backward compatibility)
@@ -5295,14 +5365,14 @@ def main():
     aston_parser.add_argument('file', help='Path to Python source file')
     aston_parser.add_argument('--test', action='store_true', help='Run round-trip test instead of outputting tuples')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.command == 'init':
         command_init()
     elif args.command == 'whoami':
         command_whoami(args.subcommand, args.value)
     elif args.command == 'add':
-        code_add(args.file, args.comment)
+        code_add_many(args.file, args.comment)
     elif args.command == 'get':
         code_get(args.hash)
     elif args.command == 'show':
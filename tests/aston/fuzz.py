@@ -11,18 +11,30 @@ All tests verify the round-trip invariant: ast == aston_read(aston_write(ast))
 """
 
 import ast
+import hashlib
+import json
+import os
 import random
 import sys
 import traceback
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Callable, Iterator, List, Tuple, Optional
 
 # Import ASTON from bb.py
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from bb import aston_write, aston_read
 
 # Import AST code generator
-from tests.code.code import generate as generate_ast_code
+from tests.code.code import generate_tree as generate_ast_tree
+
+
+# compile() flags equivalent to ast.parse, without its Python-level wrapper
+_PARSE_FLAGS = ast.PyCF_ONLY_AST
+
+# Append-only JSON Lines log of failing samples, one object per failure
+FAILURE_LOG = "/tmp/aston_fuzz_failures.jsonl"
 
 
 # Mutation fuzzing constants and utilities
@@ -43,54 +55,110 @@ IMPORT_ITEMS = {
     "datetime": ["datetime", "date", "time", "timedelta"],
 }
 
+# Every (module, item) pair usable in a from-import, computed once
+IMPORT_PAIRS = tuple(
+    (module, item)
+    for module in IMPORT_MODULES if module in IMPORT_ITEMS
+    for item in IMPORT_ITEMS[module]
+)
 
-def mutate_add_imports(code: str, rng: random.Random) -> str:
-    """Add random import statements to code."""
+MUTATION_TYPES = ("import", "from_import", "from_import_as")
+
+
+def mutate_import_block(rng: random.Random) -> str:
+    """Build a block of random import statements."""
     mutations = []
     num_imports = rng.randint(1, 5)
 
     for _ in range(num_imports):
-        mutation_type = rng.choice(["import", "from_import", "from_import_as"])
+        mutation_type = rng.choice(MUTATION_TYPES)
 
         if mutation_type == "import":
             module = rng.choice(IMPORT_MODULES)
             mutations.append(f"import {module}")
         elif mutation_type == "from_import":
-            module = rng.choice([m for m in IMPORT_MODULES if m in IMPORT_ITEMS])
-            items = IMPORT_ITEMS[module]
-            item = rng.choice(items)
+            module, item = rng.choice(IMPORT_PAIRS)
             mutations.append(f"from {module} import {item}")
         elif mutation_type == "from_import_as":
-            module = rng.choice([m for m in IMPORT_MODULES if m in IMPORT_ITEMS])
-            items = IMPORT_ITEMS[module]
-            item = rng.choice(items)
+            module, item = rng.choice(IMPORT_PAIRS)
             alias = f"{item}_alias_{rng.randint(0, 999)}"
             mutations.append(f"from {module} import {item} as {alias}")
 
-    import_block = "\n".join(mutations)
-    return f"{import_block}\n\n{code}"
+    return "\n".join(mutations)
 
 
-def mutate_code(code: str, seed: int) -> str:
-    """Apply deterministic mutations to code based on seed."""
-    rng = random.Random(seed)
-    mutated = mutate_add_imports(code, rng)
+def mutate_add_imports(code: str, rng: random.Random) -> str:
+    """Add random import statements to code."""
+    return f"{mutate_import_block(rng)}\n\n{code}"
 
-    try:
-        ast.parse(mutated)
-        return mutated
-    except SyntaxError:
-        return code
 
+def seeded_rng(seed: int, rng: Optional[random.Random] = None) -> random.Random:
+    """Return rng reseeded with seed, or a new Random(seed) when rng is None.
 
-class FuzzResult:
-    """Result of a single fuzz test."""
+    Reseeding one instance draws the same sequence as a fresh Random(seed)
+    without allocating a new generator per mutation.
+    """
+    if rng is None:
+        return random.Random(seed)
+    rng.seed(seed)
+    return rng
 
-    def __init__(self, success: bool, error: str = "", code: str = "", test_id: str = ""):
-        self.success = success
-        self.error = error
-        self.code = code
-        self.test_id = test_id
+
+def mutate_code(code: str, seed: int, rng: Optional[random.Random] = None) -> str:
+    """Apply deterministic mutations to code based on seed.
+
+    Mutations only prepend imports built from the tables above, which are
+    always valid Python, so the result is not re-parsed here.
+    """
+    return mutate_add_imports(code, seeded_rng(seed, rng))
+
+
+def mutate_tree(base_tree: ast.Module, seed: int,
+                rng: Optional[random.Random] = None) -> Tuple[str, ast.Module]:
+    """Same mutation as mutate_code, spliced onto an already parsed base tree.
+
+    Only the small import block is parsed; the base tree nodes are shared
+    between mutations, which is fine since round-trips do not modify them.
+    Returns (import_block, tree).
+    """
+    import_block = mutate_import_block(seeded_rng(seed, rng))
+    imports = compile(import_block, '<fuzz>', 'exec', flags=_PARSE_FLAGS, dont_inherit=True).body
+    return import_block, ast.Module(body=imports + base_tree.body, type_ignores=[])
+
+
+def ast_hash(node: ast.AST) -> bytes:
+    """Digest the structure of an AST, ignoring locations like ast.dump does.
+
+    Feeds node class names, field names and primitive values to a blake2b
+    hasher while walking the tree, so comparing two trees does not need to
+    build their full dump strings.
+    """
+    hasher = hashlib.blake2b(digest_size=32)
+    update = hasher.update
+
+    def visit(value):
+        if isinstance(value, ast.AST):
+            update(b'(' + type(value).__name__.encode())
+            for field, child in ast.iter_fields(value):
+                update(b' ' + field.encode() + b'=')
+                visit(child)
+            update(b')')
+        elif isinstance(value, list):
+            update(b'[')
+            for item in value:
+                visit(item)
+                update(b',')
+            update(b']')
+        else:
+            update(repr(value).encode('utf-8', 'surrogatepass'))
+
+    visit(node)
+    return hasher.digest()
+
+
+# Result of a single fuzz test: FuzzResult(success, error="", code="", test_id="").
+# code is only filled in for failures, successful results stay small.
+FuzzResult = namedtuple('FuzzResult', ['success', 'error', 'code', 'test_id'], defaults=("", "", ""))
 
 
 def test_round_trip(code: str, test_id: str) -> FuzzResult:
@@ -101,65 +169,163 @@ def test_round_trip(code: str, test_id: str) -> FuzzResult:
     """
     try:
         # Parse original
-        tree = ast.parse(code)
+        tree = compile(code, '<fuzz>', 'exec', flags=_PARSE_FLAGS, dont_inherit=True)
+    except SyntaxError as e:
+        # Invalid Python - skip (shouldn't happen with generator)
+        error = f"SyntaxError: {e}"
+        return FuzzResult(False, error, code, test_id)
 
-        # Convert to ASTON and back
-        _, tuples = aston_write(tree)
-        reconstructed = aston_read(tuples)
+    return test_round_trip_tree(tree, code, test_id)
 
-        # Compare using ast.dump (structural equivalence)
-        original_dump = ast.dump(tree)
-        reconstructed_dump = ast.dump(reconstructed)
 
-        if original_dump != reconstructed_dump:
-            error = f"AST structural mismatch"
-            return FuzzResult(False, error, code, test_id)
+def test_round_trip_tree(tree: ast.Module, code: Optional[str], test_id: str) -> FuzzResult:
+    """Test ASTON round-trip for an already parsed tree of code.
 
-        # Verify code equivalence
-        original_code = ast.unparse(tree)
-        reconstructed_code = ast.unparse(reconstructed)
+    code may be None for trees built directly (generative fuzzing); it is then
+    unparsed from the tree only if the round-trip fails.
+
+    Returns:
+        FuzzResult with success status and error details
+    """
+    try:
+        # Convert to ASTON and back
+        _, tuples = aston_write(tree)
+        reconstructed = aston_read(tuples)
 
-        if original_code != reconstructed_code:
-            error = f"Code mismatch:\nOriginal:\n{original_code[:200]}\nReconstructed:\n{reconstructed_code[:200]}"
-            return FuzzResult(False, error, code, test_id)
+        # Compare structural digests (same equivalence as ast.dump). ast.unparse
+        # is a function of that structure, so equal digests imply equal code and
+        # unparsing is only needed to describe a mismatch.
+        if ast_hash(tree) != ast_hash(reconstructed):
+            original_code = ast.unparse(tree)
+            reconstructed_code = ast.unparse(reconstructed)
+            error = f"AST structural mismatch:\nOriginal:\n{original_code[:200]}\nReconstructed:\n{reconstructed_code[:200]}"
+            return FuzzResult(False, error, code if code is not None else original_code, test_id)
 
-        return FuzzResult(True, "", code, test_id)
+        return FuzzResult(True, test_id=test_id)
 
-    except SyntaxError as e:
-        # Invalid Python - skip (shouldn't happen with generator)
-        error = f"SyntaxError: {e}"
-        return FuzzResult(False, error, code, test_id)
     except Exception as e:
         error = f"{type(e).__name__}: {e}\n{traceback.format_exc()}"
+        if code is None:
+            try:
+                code = ast.unparse(tree)
+            except Exception:
+                code = ast.dump(tree)
         return FuzzResult(False, error, code, test_id)
 
 
-def save_failure(code: str, test_id: str, error: str) -> str:
-    """Save failing code to /tmp and return filepath."""
-    filename = f"/tmp/aston_fuzz_fail_{test_id}.py"
+def round_trip_item(item: Tuple) -> FuzzResult:
+    """Round-trip a (code, test_id) or (code, test_id, tree) work item, for executor.map."""
+    if len(item) == 3:
+        return test_round_trip_tree(item[2], item[0], item[1])
+    code, test_id = item
+    return test_round_trip(code, test_id)
+
+
+def generate_round_trip(seed: int) -> Optional[FuzzResult]:
+    """Generate the tree for seed and round-trip it, for executor.map.
+
+    Returns None when the generator fails to produce valid code for seed.
+    """
+    # Generate the tree directly, there is no need to parse its code
+    tree = generate_ast_tree(seed=seed, energy=1000)
+    if tree is None:
+        return None
+    return test_round_trip_tree(tree, None, f"generated_seed{seed}")
 
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(f"# Failure: {error}\n")
-        f.write(f"# Test ID: {test_id}\n\n")
-        f.write(code)
 
-    return filename
+def read_source(entry: os.DirEntry) -> str:
+    """Read a UTF-8 source file from a scandir entry with raw os.open/os.read."""
+    fd = os.open(entry.path, os.O_RDONLY)
+    try:
+        chunks = []
+        size = max(entry.stat().st_size, 1)
+        while True:
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b''.join(chunks).decode('utf-8')
 
 
 class FuzzStrategy:
     """Base class for fuzzing strategies."""
 
-    def __init__(self, name: str):
+    __slots__ = ('name', 'jobs', 'passed', 'failed', 'skipped', 'failures', 'log', 'log_offset')
+
+    def __init__(self, name: str, jobs: int = 1):
         self.name = name
+        self.jobs = jobs
         self.passed = 0
         self.failed = 0
         self.skipped = 0
         self.failures = []
+        self.log = None
+        self.log_offset = 0
 
     def run(self):
         """Run the fuzzing strategy. Override in subclasses."""
         raise NotImplementedError
 
+    def save_failure(self, code: str, test_id: str, error: str, reproduce: str):
+        """Append a failing sample to FAILURE_LOG and remember a short summary.
+
+        The log is opened on the first failure and kept open with a large
+        buffer; only the test id, the head of the error and the line offset
+        in the log stay in memory. The offset is a running byte count, since
+        tell() on a text file would flush the buffer on every failure.
+        """
+        if self.log is None:
+            self.log = open(FAILURE_LOG, 'a', encoding='utf-8', buffering=1 << 16)
+            self.log_offset = self.log.tell()
+
+        offset = self.log_offset
+        line = json.dumps({
+            'test_id': test_id,
+            'error': error,
+            'code': code,
+            'reproduce': reproduce,
+        }) + "\n"
+        self.log.write(line)
+        self.log_offset += len(line.encode('utf-8'))
+
+        self.failures.append({
+            'test_id': test_id,
+            'error': error[:100],
+            'offset': offset,
+            'reproduce': reproduce,
+        })
+
+    def close(self):
+        """Flush and close the failure log if any failure was recorded."""
+        if self.log is not None:
+            self.log.close()
+            self.log = None
+
+    def round_trip_all(self, items: List, chunksize: int = 16,
+                       worker: Callable = round_trip_item) -> Iterator[Optional[FuzzResult]]:
+        """Apply worker to work items (see round_trip_item), in order, using self.jobs processes.
+
+        Round-trips are CPU-bound and independent, so with jobs > 1 they are
+        spread over a process pool; with jobs == 1 they run in this process.
+        """
+        if self.jobs <= 1 or len(items) <= 1:
+            yield from map(worker, items)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            yield from executor.map(worker, items, chunksize=chunksize)
+
+    def progress(self, done: int, total: int):
+        """Print one progress line per tenth of total, instead of one per test.
+
+        tqdm is not a dependency; failures are still printed as they happen.
+        """
+        step = max(1, total // 10)
+        if done % step == 0 or done == total:
+            print(f"  … {done}/{total} tests run: {self.passed} passed, {self.failed} failed, {self.skipped} skipped")
+
     def report(self):
         """Print summary report."""
         total = self.passed + self.failed + self.skipped
@@ -175,16 +341,18 @@ class FuzzStrategy:
         if self.failures:
             print(f"\nFailures:")
             for failure in self.failures:
-                print(f"  {failure['test_id']}: {failure['error'][:100]}")
-                print(f"    File: {failure['filepath']}")
+                print(f"  {failure['test_id']}: {failure['error']}")
+                print(f"    Log: {FAILURE_LOG} (offset {failure['offset']})")
                 print(f"    Reproduce: {failure['reproduce']}")
 
 
 class CorpusFuzzStrategy(FuzzStrategy):
     """Test fixed corpus of example files."""
 
-    def __init__(self):
-        super().__init__("Corpus Fuzzing")
+    __slots__ = ('examples_dir',)
+
+    def __init__(self, jobs: int = 1):
+        super().__init__("Corpus Fuzzing", jobs)
         self.examples_dir = Path(__file__).parent.parent.parent / 'examples'
 
     def run(self):
@@ -193,43 +361,45 @@ class CorpusFuzzStrategy(FuzzStrategy):
             print(f"⚠ Examples directory not found: {self.examples_dir}")
             return
 
-        example_files = sorted(self.examples_dir.glob('*.py'))
+        with os.scandir(self.examples_dir) as it:
+            example_files = sorted(
+                (entry for entry in it
+                 if entry.name.endswith('.py') and not entry.name.startswith('.') and entry.is_file()),
+                key=lambda entry: entry.name,
+            )
         print(f"\n[1/3] Testing corpus: {len(example_files)} example files")
 
-        for filepath in example_files:
+        readable = []
+        items = []
+        for entry in example_files:
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    code = f.read()
-
-                test_id = f"corpus_{filepath.stem}"
-                result = test_round_trip(code, test_id)
-
-                if result.success:
-                    self.passed += 1
-                    print(f"  ✓ {filepath.name}")
-                else:
-                    self.failed += 1
-                    saved_path = save_failure(code, test_id, result.error)
-                    print(f"  ✗ {filepath.name}: FAILED")
-                    print(f"    Error: {result.error[:100]}")
-
-                    self.failures.append({
-                        'test_id': test_id,
-                        'error': result.error,
-                        'filepath': saved_path,
-                        'reproduce': f"python3 bb.py aston --test {saved_path}",
-                    })
-
+                code = read_source(entry)
             except Exception as e:
                 self.failed += 1
-                print(f"  ✗ {filepath.name}: Exception: {e}")
+                print(f"  ✗ {entry.name}: Exception: {e}")
+                continue
+            readable.append(entry)
+            items.append((code, f"corpus_{entry.name[:-3]}"))
+
+        for entry, (code, test_id), result in zip(readable, items, self.round_trip_all(items, chunksize=1)):
+            if result.success:
+                self.passed += 1
+                print(f"  ✓ {entry.name}")
+            else:
+                self.failed += 1
+                print(f"  ✗ {entry.name}: FAILED")
+                print(f"    Error: {result.error[:100]}")
+
+                self.save_failure(code, test_id, result.error, f"python3 bb.py aston --test {entry.path}")
 
 
 class MutationFuzzStrategy(FuzzStrategy):
     """Test mutations of base corpus."""
 
-    def __init__(self, num_mutations: int = 50):
-        super().__init__("Mutation Fuzzing")
+    __slots__ = ('num_mutations', 'base_corpus')
+
+    def __init__(self, num_mutations: int = 50, jobs: int = 1):
+        super().__init__("Mutation Fuzzing", jobs)
         self.num_mutations = num_mutations
         self.base_corpus = [
             "x = 1",
@@ -246,15 +416,22 @@ class MutationFuzzStrategy(FuzzStrategy):
         total_tests = len(self.base_corpus) * self.num_mutations
         print(f"\n[2/3] Testing mutations: {len(self.base_corpus)} base × {self.num_mutations} mutations = {total_tests} tests")
 
+        # Parse each base once and splice the mutated imports in front of it
+        items = []
+        rng = random.Random()
         for base_idx, base_code in enumerate(self.base_corpus):
+            base_tree = compile(base_code, '<fuzz>', 'exec', flags=_PARSE_FLAGS, dont_inherit=True)
+            for seed in range(self.num_mutations):
+                import_block, tree = mutate_tree(base_tree, seed, rng)
+                items.append((f"{import_block}\n\n{base_code}", f"mutation_base{base_idx}_seed{seed}", tree))
+        results = self.round_trip_all(items)
+
+        for base_idx in range(len(self.base_corpus)):
             base_passed = 0
             base_failed = 0
 
             for seed in range(self.num_mutations):
-                mutated_code = mutate_code(base_code, seed)
-                test_id = f"mutation_base{base_idx}_seed{seed}"
-
-                result = test_round_trip(mutated_code, test_id)
+                result = next(results)
 
                 if result.success:
                     self.passed += 1
@@ -262,14 +439,8 @@ class MutationFuzzStrategy(FuzzStrategy):
                 else:
                     self.failed += 1
                     base_failed += 1
-                    saved_path = save_failure(mutated_code, test_id, result.error)
-
-                    self.failures.append({
-                        'test_id': test_id,
-                        'error': result.error,
-                        'filepath': saved_path,
-                        'reproduce': f"python3 tests/aston/fuzz.py --mutation --seed {seed}",
-                    })
+                    self.save_failure(result.code, result.test_id, result.error,
+                                      f"python3 tests/aston/fuzz.py --mutation --seed {seed}")
 
             if base_failed == 0:
                 print(f"  ✓ Base {base_idx + 1}/{len(self.base_corpus)}: {base_passed} mutations passed")
@@ -280,8 +451,10 @@ class MutationFuzzStrategy(FuzzStrategy):
 class GenerativeFuzzStrategy(FuzzStrategy):
     """Test randomly generated AST code."""
 
-    def __init__(self, num_tests: int = 100, start_seed: int = 0):
-        super().__init__("Generative Fuzzing")
+    __slots__ = ('num_tests', 'start_seed')
+
+    def __init__(self, num_tests: int = 100, start_seed: int = 0, jobs: int = 1):
+        super().__init__("Generative Fuzzing", jobs)
         self.num_tests = num_tests
         self.start_seed = start_seed
 
@@ -289,36 +462,25 @@ class GenerativeFuzzStrategy(FuzzStrategy):
         """Generate and test random AST code."""
         print(f"\n[3/3] Testing generated code: {self.num_tests} tests (seeds {self.start_seed}-{self.start_seed + self.num_tests - 1})")
 
-        for i in range(self.num_tests):
-            seed = self.start_seed + i
-            test_id = f"generated_seed{seed}"
-
-            # Generate code
-            code = generate_ast_code(seed=seed, energy=1000)
+        # Generation runs in the workers too, each seed is independent
+        seeds = range(self.start_seed, self.start_seed + self.num_tests)
+        results = self.round_trip_all(seeds, chunksize=32, worker=generate_round_trip)
 
-            if code is None:
+        for i, (seed, result) in enumerate(zip(seeds, results)):
+            if result is None:
                 # Generator failed to produce valid code
                 self.skipped += 1
-                continue
-
-            result = test_round_trip(code, test_id)
-
-            if result.success:
+            elif result.success:
                 self.passed += 1
-                if (i + 1) % 10 == 0:
-                    print(f"  ✓ {i + 1}/{self.num_tests} tests passed")
             else:
                 self.failed += 1
-                saved_path = save_failure(code, test_id, result.error)
                 print(f"  ✗ Seed {seed}: FAILED")
                 print(f"    Error: {result.error[:100]}")
 
-                self.failures.append({
-                    'test_id': test_id,
-                    'error': result.error,
-                    'filepath': saved_path,
-                    'reproduce': f"python3 tests/aston/fuzz.py --generative --seed {seed}",
-                })
+                self.save_failure(result.code, result.test_id, result.error,
+                                  f"python3 tests/aston/fuzz.py --generative --seed {seed}")
+
+            self.progress(i + 1, self.num_tests)
 
         if self.passed > 0:
             print(f"  ✓ Total: {self.passed}/{self.num_tests} passed")
@@ -336,6 +498,8 @@ def main():
     parser.add_argument('--seed', type=int, default=0, help='Starting seed for generative fuzzing')
     parser.add_argument('--mutations', type=int, default=50, help='Mutations per base (default: 50)')
     parser.add_argument('--tests', type=int, default=100, help='Number of generative tests (default: 100)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for round-trips (default: CPU count, 1 runs in-process)')
 
     args = parser.parse_args()
 
@@ -347,17 +511,20 @@ def main():
 
     # Determine which strategies to run
     if args.corpus or not (args.mutation or args.generative):
-        strategies.append(CorpusFuzzStrategy())
+        strategies.append(CorpusFuzzStrategy(jobs=args.jobs))
 
     if args.mutation or not (args.corpus or args.generative):
-        strategies.append(MutationFuzzStrategy(num_mutations=args.mutations))
+        strategies.append(MutationFuzzStrategy(num_mutations=args.mutations, jobs=args.jobs))
 
     if args.generative or not (args.corpus or args.mutation):
-        strategies.append(GenerativeFuzzStrategy(num_tests=args.tests, start_seed=args.seed))
+        strategies.append(GenerativeFuzzStrategy(num_tests=args.tests, start_seed=args.seed, jobs=args.jobs))
 
     # Run all strategies
     for strategy in strategies:
-        strategy.run()
+        try:
+            strategy.run()
+        finally:
+            strategy.close()
         strategy.report()
 
     # Overall summary
@@ -386,9 +553,8 @@ def main():
         print("=" * 70)
         for failure in all_failures:
             print(f"\n{failure['test_id']}:")
-            print(f"  Error: {failure['error'][:150]}")
-            print(f"  File:  {failure['filepath']}")
-            print(f"  Test:  python3 bb.py aston --test {failure['filepath']}")
+            print(f"  Error: {failure['error']}")
+            print(f"  Log:   {FAILURE_LOG} (offset {failure['offset']})")
             print(f"  Repro: {failure['reproduce']}")
 
     if total_failed > 0:
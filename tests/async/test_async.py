@@ -9,7 +9,7 @@ import ast
 import pytest
 
 import bb
-from tests.conftest import normalize_code_for_test
+from tests.conftest import code_normalize_for_test, normalize_code_for_test, parse_code_for_test
 
 
 # =============================================================================
@@ -82,7 +82,7 @@ def test_normalize_simple_async_function():
     """Fetch data asynchronously"""
     return await some_api()
 '''
-    tree = ast.parse(code)
+    tree = parse_code_for_test(code)
 
     func_def, imports = bb.code_extract_definition(tree)
 
@@ -97,7 +97,7 @@ def test_normalize_async_function_with_parameters():
     result = await do_work(item)
     return result
 '''
-    tree = ast.parse(code)
+    tree = parse_code_for_test(code)
     func_def, imports = bb.code_extract_definition(tree)
 
     name_mapping, reverse_mapping = bb.code_create_name_mapping(func_def, imports, {})
@@ -117,7 +117,7 @@ def test_normalize_async_function_with_await_expressions():
     result = await response.json()
     return result
 '''
-    tree = ast.parse(code)
+    tree = parse_code_for_test(code)
     func_def, imports = bb.code_extract_definition(tree)
 
     name_mapping, reverse_mapping = bb.code_create_name_mapping(func_def, imports, {})
@@ -143,11 +143,8 @@ def test_async_function_hash_determinism():
     return result
 '''
 
-    tree_eng = ast.parse(code_eng)
-    tree_fra = ast.parse(code_fra)
-
-    _, normalized_eng_no_doc, _, _, _ = bb.code_normalize(tree_eng, "eng")
-    _, normalized_fra_no_doc, _, _, _ = bb.code_normalize(tree_fra, "fra")
+    _, normalized_eng_no_doc, _, _, _ = code_normalize_for_test(code_eng, "eng")
+    _, normalized_fra_no_doc, _, _, _ = code_normalize_for_test(code_fra, "fra")
 
     hash_eng = bb.hash_compute(normalized_eng_no_doc)
     hash_fra = bb.hash_compute(normalized_fra_no_doc)
@@ -161,9 +158,7 @@ def test_async_function_preserves_async_keyword():
     """Do async stuff"""
     return await something()
 '''
-    tree = ast.parse(code)
-
-    normalized_with_doc, normalized_without_doc, _, _, _ = bb.code_normalize(tree, "eng")
+    normalized_with_doc, normalized_without_doc, _, _, _ = code_normalize_for_test(code, "eng")
 
     assert "async def _bb_v_0" in normalized_with_doc
     assert "async def _bb_v_0" in normalized_without_doc
@@ -191,7 +186,7 @@ def test_names_collect_includes_async_function():
     local_var = 42
     return local_var
 '''
-    tree = ast.parse(code)
+    tree = parse_code_for_test(code)
 
     names = bb.code_collect_names(tree)
 
@@ -6,9 +6,10 @@ Grey-box style:
 - Test: Call CLI commands
 - Assert: Check output and files
 """
-import json
 from pathlib import Path
 
+from tests.conftest import HASH_PATTERN, load_json
+
 
 def test_add_function_with_check_decorator(cli_runner, tmp_path):
     """Test adding a function with @check decorator stores checks in metadata"""
@@ -41,14 +42,13 @@ def test_add():
     assert 'Hash:' in result.stdout
 
     # Extract hash
-    test_hash = result.stdout.split('Hash:')[1].strip().split()[0]
+    test_hash = HASH_PATTERN.search(result.stdout).group(1)
 
     # Verify metadata contains checks
     func_dir = cli_runner.pool_dir / test_hash[:2] / test_hash[2:]
     object_json = func_dir / 'object.json'
 
-    with open(object_json, 'r') as f:
-        data = json.load(f)
+    data = load_json(object_json)
 
     assert 'metadata' in data
     assert 'checks' in data['metadata']
@@ -94,14 +94,13 @@ def test_math():
     assert result.returncode == 0
 
     # Extract hash
-    test_hash = result.stdout.split('Hash:')[1].strip().split()[0]
+    test_hash = HASH_PATTERN.search(result.stdout).group(1)
 
     # Verify metadata contains both checks
     func_dir = cli_runner.pool_dir / test_hash[:2] / test_hash[2:]
     object_json = func_dir / 'object.json'
 
-    with open(object_json, 'r') as f:
-        data = json.load(f)
+    data = load_json(object_json)
 
     assert 'metadata' in data
     assert 'checks' in data['metadata']
@@ -132,7 +131,7 @@ def test_multiply():
 ''')
 
     result = cli_runner.run(['add', f'{test_file}@eng'])
-    test_hash = result.stdout.split('Hash:')[1].strip().split()[0]
+    test_hash = HASH_PATTERN.search(result.stdout).group(1)
 
     # Test: Run check command
     check_result = cli_runner.run(['check', target_hash])
@@ -219,14 +218,13 @@ def test_add_function_without_check_decorator(cli_runner, tmp_path):
     assert result.returncode == 0
 
     # Extract hash
-    func_hash = result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(result.stdout).group(1)
 
     # Verify metadata does NOT contain checks
     func_dir = cli_runner.pool_dir / func_hash[:2] / func_hash[2:]
     object_json = func_dir / 'object.json'
 
-    with open(object_json, 'r') as f:
-        data = json.load(f)
+    data = load_json(object_json)
 
     assert 'metadata' in data
     # checks should not be present (or should be empty/None)
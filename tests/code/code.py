@@ -9,15 +9,33 @@ The generator will be used in the Aston fuzzer for testing AST normalization.
 """
 
 import ast
+import functools
+import keyword
+import os
 import random
 import sys
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
 
 
+# All AST node classes exported by the ast module (except ast.AST itself),
+# as (name, class) pairs in dir(ast) order
+AST_MEMBERS = tuple(
+    (name, obj)
+    for name in dir(ast)
+    for obj in [getattr(ast, name)]
+    if isinstance(obj, type) and issubclass(obj, ast.AST) and obj is not ast.AST
+)
+
+
+@functools.lru_cache(maxsize=1)
 def introspect_ast_nodes() -> Dict[str, Dict[str, str]]:
     """
     Introspect all AST node types and their field types.
 
+    The result is cached for the life of the process; callers must not
+    mutate it.
+
     Returns:
         Dictionary mapping node class names to their field types:
         {
@@ -29,18 +47,7 @@ def introspect_ast_nodes() -> Dict[str, Dict[str, str]]:
     """
     node_field_types = {}
 
-    # Get all AST node classes
-    for name in dir(ast):
-        obj = getattr(ast, name)
-
-        # Skip non-classes and non-AST nodes
-        if not isinstance(obj, type):
-            continue
-        if not issubclass(obj, ast.AST):
-            continue
-        if obj is ast.AST:
-            continue
-
+    for name, obj in AST_MEMBERS:
         # Get fields and their types
         if hasattr(obj, '_fields'):
             field_types = {}
@@ -54,6 +61,111 @@ def introspect_ast_nodes() -> Dict[str, Dict[str, str]]:
     return node_field_types
 
 
+# Field types that depend on the node class, keyed by (class_name, field_name).
+# This is a manual mapping based on Python AST documentation.
+SPECIAL_FIELD_TYPES = {
+    # Literal payloads
+    ('Constant', 'value'): 'constant',
+    ('Num', 'value'): 'constant',
+    ('Str', 'value'): 'constant',
+    ('Bytes', 'value'): 'constant',
+    ('NameConstant', 'value'): 'constant',
+    ('Ellipsis', 'value'): 'constant',
+    ('Assign', 'value'): 'expr',
+    ('AugAssign', 'value'): 'expr',
+    ('AnnAssign', 'value'): 'expr',
+    ('Return', 'value'): 'expr',
+    ('Attribute', 'value'): 'expr',
+    ('Subscript', 'value'): 'expr',
+    # Lambda.body and IfExp.body/orelse are expr, not stmt*
+    ('Lambda', 'body'): 'expr',
+    ('IfExp', 'body'): 'expr',
+    ('IfExp', 'orelse'): 'expr',
+    # FunctionDef/AsyncFunctionDef/Lambda.args is 'arguments', not 'arg*'
+    ('FunctionDef', 'args'): 'arguments',
+    ('AsyncFunctionDef', 'args'): 'arguments',
+    ('Lambda', 'args'): 'arguments',
+    # Global/Nonlocal use identifier*, Import/ImportFrom use alias*
+    ('Global', 'names'): 'identifier*',
+    ('Nonlocal', 'names'): 'identifier*',
+    # AnnAssign.annotation is required, others might be optional
+    ('AnnAssign', 'annotation'): 'expr',
+    ('BoolOp', 'op'): 'boolop',
+    ('UnaryOp', 'op'): 'unaryop',
+    # Compare uses cmpop*, others use operator*
+    ('Compare', 'ops'): 'cmpop*',
+}
+
+# Field types keyed by field name alone, used when no special case applies.
+GENERIC_FIELD_TYPES = {
+    # Common patterns
+    'lineno': 'int',
+    'col_offset': 'int',
+    'end_lineno': 'int',
+    'end_col_offset': 'int',
+    'name': 'identifier',
+    'id': 'identifier',
+    'attr': 'identifier',
+    'arg': 'identifier',
+    'module': 'identifier',
+    'asname': 'identifier?',
+    # Lists
+    'body': 'stmt*',
+    'orelse': 'stmt*',
+    'finalbody': 'stmt*',
+    'elts': 'expr*',
+    'keys': 'expr*',
+    'values': 'expr*',
+    'comparators': 'expr*',
+    'args': 'arg*',
+    'posonlyargs': 'arg*',
+    'kwonlyargs': 'arg*',
+    'names': 'alias*',
+    'bases': 'expr*',
+    'keywords': 'expr*',
+    'decorator_list': 'expr*',
+    'targets': 'expr*',
+    'handlers': 'excepthandler*',
+    'items': 'withitem*',
+    'ifs': 'expr*',
+    'generators': 'comprehension*',
+    # Optional fields
+    'returns': 'expr?',
+    'type_comment': 'string?',
+    'defaults': 'expr*',
+    'kw_defaults': 'expr*',
+    # Single nodes
+    'test': 'expr',
+    'iter': 'expr',
+    'target': 'expr',
+    'left': 'expr',
+    'right': 'expr',
+    'func': 'expr',
+    'lower': 'expr',
+    'upper': 'expr',
+    'step': 'expr',
+    'cause': 'expr?',
+    'exc': 'expr?',
+    'type': 'expr?',
+    'slice': 'expr',
+    'annotation': 'expr?',
+    'simple': 'int',
+    # Operators and context
+    'op': 'operator',
+    'ops': 'operator*',
+    'ctx': 'expr_context',
+    'boolop': 'boolop',
+    'unaryop': 'unaryop',
+    'cmpop': 'cmpop*',
+    # Special cases
+    'kind': 'string?',
+    'n': 'constant',
+    's': 'constant',
+    'vararg': 'arg?',
+    'kwarg': 'arg?',
+}
+
+
 def infer_field_type(node_class: type, field_name: str) -> str:
     """
     Infer the type of a field by examining the AST node class.
@@ -69,135 +181,21 @@ def infer_field_type(node_class: type, field_name: str) -> str:
     - 'stmt*': list of statement nodes
     - 'expr?': optional expression node
     - etc.
-    """
-    # This is a manual mapping based on Python AST documentation
-    # In practice, we need to inspect actual instances or refer to docs
-
-    # Common patterns
-    if field_name in ['lineno', 'col_offset', 'end_lineno', 'end_col_offset']:
-        return 'int'
-    if field_name in ['name', 'id', 'attr', 'arg', 'module']:
-        return 'identifier'
-    if field_name in ['asname']:
-        return 'identifier?'
-    if field_name == 'value':
-        # Special handling for value field
-        if node_class.__name__ in ['Constant', 'Num', 'Str', 'Bytes', 'NameConstant', 'Ellipsis']:
-            return 'constant'
-        elif node_class.__name__ in ['Assign', 'AugAssign', 'AnnAssign', 'Return']:
-            return 'expr'
-        elif node_class.__name__ in ['Attribute', 'Subscript']:
-            return 'expr'
-        else:
-            return 'unknown'
-
-    # Lists
-    if field_name in ['body', 'orelse', 'finalbody']:
-        # Lambda.body is expr, not stmt*
-        if node_class.__name__ == 'Lambda' and field_name == 'body':
-            return 'expr'
-        # IfExp.body and IfExp.orelse are expr, not stmt*
-        if node_class.__name__ == 'IfExp' and field_name in ['body', 'orelse']:
-            return 'expr'
-        return 'stmt*'
-    if field_name in ['elts', 'keys', 'values', 'comparators']:
-        return 'expr*'
-    if field_name in ['args', 'posonlyargs', 'kwonlyargs']:
-        # FunctionDef/AsyncFunctionDef/Lambda.args is 'arguments', not 'arg*'
-        if node_class.__name__ in ['FunctionDef', 'AsyncFunctionDef', 'Lambda'] and field_name == 'args':
-            return 'arguments'
-        return 'arg*'
-    if field_name in ['names']:
-        # Import/ImportFrom use alias*, Global/Nonlocal use identifier*
-        if node_class.__name__ in ['Import', 'ImportFrom']:
-            return 'alias*'
-        elif node_class.__name__ in ['Global', 'Nonlocal']:
-            return 'identifier*'
-        else:
-            return 'alias*'  # default
-    if field_name in ['bases', 'keywords', 'decorator_list']:
-        return 'expr*'
-    if field_name in ['targets']:
-        return 'expr*'
-    if field_name in ['handlers']:
-        return 'excepthandler*'
-    if field_name in ['items']:
-        return 'withitem*'
-    if field_name in ['ifs']:
-        return 'expr*'
-    if field_name in ['generators']:
-        return 'comprehension*'
-
-    # Optional fields
-    if field_name == 'returns':
-        return 'expr?'
-    if field_name == 'type_comment':
-        return 'string?'
-    if field_name in ['defaults', 'kw_defaults']:
-        return 'expr*'
-
-    # Single nodes
-    if field_name in ['test', 'iter', 'target', 'left', 'right', 'func', 'lower', 'upper', 'step']:
-        return 'expr'
-    if field_name in ['cause']:
-        return 'expr?'
-    if field_name in ['exc']:
-        return 'expr?'
-    if field_name in ['type']:
-        return 'expr?'
-    if field_name in ['slice']:
-        return 'expr'
-    if field_name == 'annotation':
-        # AnnAssign.annotation is required, others might be optional
-        if node_class.__name__ == 'AnnAssign':
-            return 'expr'
-        else:
-            return 'expr?'
-    if field_name in ['simple']:
-        return 'int'
-
-    # Operators and context
-    if field_name == 'op':
-        # Check node class to determine operator type
-        if node_class.__name__ == 'BoolOp':
-            return 'boolop'
-        elif node_class.__name__ == 'UnaryOp':
-            return 'unaryop'
-        else:
-            return 'operator'
-    if field_name == 'ops':
-        # Compare uses cmpop*, others use operator*
-        if node_class.__name__ == 'Compare':
-            return 'cmpop*'
-        else:
-            return 'operator*'
-    if field_name in ['ctx']:
-        return 'expr_context'
-    if field_name in ['boolop']:
-        return 'boolop'
-    if field_name in ['unaryop']:
-        return 'unaryop'
-    if field_name in ['cmpop']:
-        return 'cmpop*'
-
-    # Special cases
-    if field_name == 'kind':
-        return 'string?'
-    if field_name == 'n':
-        return 'constant'
-    if field_name == 's':
-        return 'constant'
-    if field_name in ['vararg', 'kwarg']:
-        return 'arg?'
 
-    # Default: try to infer from context
-    return 'unknown'
+    Fields missing from both tables (including 'value' on nodes without a
+    special case) are reported as 'unknown'.
+    """
+    return (SPECIAL_FIELD_TYPES.get((node_class.__name__, field_name))
+            or GENERIC_FIELD_TYPES.get(field_name, 'unknown'))
 
 
+@functools.lru_cache(maxsize=1)
 def get_usable_nodes() -> Dict[str, Dict[str, str]]:
     """
     Get all AST nodes that don't have unknown field types.
 
+    Cached like introspect_ast_nodes(); callers must not mutate the result.
+
     Returns:
         Dictionary of usable nodes with their field types.
     """
@@ -224,51 +222,81 @@ def get_usable_nodes() -> Dict[str, Dict[str, str]]:
     return usable_nodes
 
 
+@functools.lru_cache(maxsize=1)
+def get_node_specs() -> Dict[str, Tuple[type, Tuple[Tuple[str, str], ...]]]:
+    """
+    Map each usable node name to its class and (field_name, field_type) pairs.
+
+    Lets generate_node() skip the getattr(ast, ...) lookup and the
+    dict.items() view on every call.
+    """
+    return {
+        node_name: (getattr(ast, node_name), tuple(fields.items()))
+        for node_name, fields in get_usable_nodes().items()
+    }
+
+
+def categorize_nodes() -> Dict[str, Tuple[str, ...]]:
+    """
+    Bucket usable node names by the name of their AST base class.
+
+    Returns:
+        Dictionary mapping each base name ('expr', 'stmt', 'operator', ...)
+        to the usable node names deriving from it, in dir(ast) order.
+    """
+    buckets = {base: [] for base in NODE_CATEGORIES}
+    for node_name, (node_class, _) in get_node_specs().items():
+        base = node_class.__bases__[0].__name__
+        if base in buckets:
+            buckets[base].append(node_name)
+    return {base: tuple(names) for base, names in buckets.items()}
+
+
+NODE_CATEGORIES = ('expr', 'stmt', 'operator', 'boolop', 'unaryop', 'cmpop', 'expr_context')
+
+_categories = categorize_nodes()
+EXPR_NODES = _categories['expr']
+STMT_NODES = _categories['stmt']
+OPERATOR_NODES = _categories['operator']
+BOOLOP_NODES = _categories['boolop']
+UNARYOP_NODES = _categories['unaryop']
+CMPOP_NODES = _categories['cmpop']
+EXPR_CONTEXT_NODES = _categories['expr_context']
+del _categories
+
+# Pools preferred at higher depths
+SIMPLE_EXPR_NODES = tuple(n for n in ('Constant', 'Name') if n in EXPR_NODES)
+SIMPLE_STMT_NODES = tuple(n for n in ('Pass', 'Expr') if n in STMT_NODES)
+
+# Operator and context classes, resolved once. Each occurrence gets a new
+# instance: returned trees belong to the caller, who may mutate them
+OPERATOR_CLASSES = tuple(getattr(ast, n) for n in OPERATOR_NODES)
+BOOLOP_CLASSES = tuple(getattr(ast, n) for n in BOOLOP_NODES)
+UNARYOP_CLASSES = tuple(getattr(ast, n) for n in UNARYOP_NODES)
+CMPOP_CLASSES = tuple(getattr(ast, n) for n in CMPOP_NODES)
+EXPR_CONTEXT_CLASSES = tuple(getattr(ast, n) for n in EXPR_CONTEXT_NODES)
+
+# Module-level statement kinds available to generate_module
+_HAS_IMPORT = 'Import' in get_usable_nodes()
+_HAS_IMPORT_FROM = 'ImportFrom' in get_usable_nodes()
+_HAS_FUNCTION_DEF = 'FunctionDef' in get_usable_nodes()
+_HAS_ASYNC_FUNCTION_DEF = 'AsyncFunctionDef' in get_usable_nodes()
+
+# Alphabet for generated identifiers
+_LETTERS = tuple('abcdefghijklmnopqrstuvwxyz')
+
+
 class ASTGenerator:
     """Random AST generator with deterministic seed and energy budget."""
 
+    __slots__ = ('rng', 'max_depth', 'energy', 'usable_nodes')
+
     def __init__(self, seed: int, max_depth: int = 3, energy: Optional[int] = None):
         self.rng = random.Random(seed)
         self.max_depth = max_depth
         self.energy = energy if energy is not None else 1000
         self.usable_nodes = get_usable_nodes()
 
-        # Categorize nodes by base type
-        self.expr_nodes = []
-        self.stmt_nodes = []
-        self.operator_nodes = []
-        self.boolop_nodes = []
-        self.unaryop_nodes = []
-        self.cmpop_nodes = []
-        self.expr_context_nodes = []
-
-        for name in dir(ast):
-            obj = getattr(ast, name)
-            if not isinstance(obj, type) or not issubclass(obj, ast.AST):
-                continue
-
-            # Only use nodes that are in usable_nodes
-            if name not in self.usable_nodes:
-                continue
-
-            # Categorize by base class
-            if hasattr(obj, '__bases__'):
-                bases = [b.__name__ for b in obj.__bases__]
-                if 'expr' in bases:
-                    self.expr_nodes.append(name)
-                elif 'stmt' in bases:
-                    self.stmt_nodes.append(name)
-                elif 'operator' in bases:
-                    self.operator_nodes.append(name)
-                elif 'boolop' in bases:
-                    self.boolop_nodes.append(name)
-                elif 'unaryop' in bases:
-                    self.unaryop_nodes.append(name)
-                elif 'cmpop' in bases:
-                    self.cmpop_nodes.append(name)
-                elif 'expr_context' in bases:
-                    self.expr_context_nodes.append(name)
-
     def consume_energy(self, amount: int = 1) -> bool:
         """
         Consume energy and return True if successful, False if exhausted.
@@ -278,13 +306,26 @@ class ASTGenerator:
         self.energy -= amount
         return True
 
+    def consume_energy_up_to(self, count: int) -> int:
+        """
+        Consume one unit of energy per item for up to count items at once.
+
+        Returns the number of items paid for (0 when exhausted).
+        """
+        n = max(0, min(count, self.energy))
+        self.energy -= n
+        return n
+
     def generate_identifier(self) -> Optional[str]:
         """Generate a random valid Python identifier."""
-        if not self.consume_energy():
+        if self.energy <= 0:
             return None
-        letters = 'abcdefghijklmnopqrstuvwxyz'
+        self.energy -= 1
+        # One rng.choice per letter: the draw order is what makes a seed
+        # reproduce tests/code/example_seed_*.py, so rng.choices is not used
         length = self.rng.randint(1, 8)
-        return ''.join(self.rng.choice(letters) for _ in range(length))
+        choice = self.rng.choice
+        return ''.join([choice(_LETTERS) for _ in range(length)])
 
     def generate_constant(self) -> Any:
         """Generate a random constant value (for use in non-assignment contexts)."""
@@ -312,128 +353,182 @@ class ASTGenerator:
             return None
         return ast.Name(id=identifier, ctx=ast.Store())
 
-    def generate_field_value(self, field_type: str, depth: int, field_name: str = '') -> Any:
-        """Generate a value for a specific field type."""
-        if not self.consume_energy():
-            return None
+    # Field generators, one per field type, called by the builders from
+    # _make_node_builder(). Each takes the depth of the node being built and the
+    # field name.
 
-        if depth >= self.max_depth:
-            # At max depth, generate simple values only
-            if field_type == 'identifier':
-                return self.generate_identifier()
-            elif field_type == 'identifier?':
-                return None if self.rng.random() < 0.5 else self.generate_identifier()
-            elif field_type == 'int':
-                return self.rng.randint(0, 10)
-            elif field_type == 'constant':
-                return self.generate_constant()
-            elif field_type in ['string', 'string?']:
-                return None if field_type == 'string?' and self.rng.random() < 0.5 else self.generate_identifier()
-            elif field_type in ['expr', 'stmt']:
-                # Return simplest possible node
-                return self.generate_simple_node(field_type)
-            elif field_type.endswith('*'):
-                return []
-            elif field_type.endswith('?'):
-                return None
-            else:
-                return None
+    def _field_identifier(self, depth: int, field_name: str) -> Optional[str]:
+        return self.generate_identifier()
 
-        # Regular generation
-        if field_type == 'identifier':
-            return self.generate_identifier()
-        elif field_type == 'identifier?':
-            return None if self.rng.random() < 0.5 else self.generate_identifier()
-        elif field_type == 'identifier*':
-            count = self.rng.randint(1, 2)
-            ids = []
-            for _ in range(count):
-                id_val = self.generate_identifier()
-                if id_val:
-                    ids.append(id_val)
-            return ids
-        elif field_type == 'int':
-            return self.rng.randint(0, 10)
-        elif field_type == 'constant':
-            return self.generate_constant()
-        elif field_type == 'string':
-            return self.generate_identifier()
-        elif field_type == 'string?':
-            return None if self.rng.random() < 0.5 else self.generate_identifier()
-        elif field_type == 'expr':
-            # Special case for assignment/loop targets
-            if field_name in ['target', 'targets']:
-                return self.generate_valid_target(depth)
-            return self.generate_expr(depth + 1)
-        elif field_type == 'expr?':
-            return None if self.rng.random() < 0.5 else self.generate_expr(depth + 1)
-        elif field_type == 'expr*':
-            # Special case for assignment/delete targets
-            if field_name in ['targets']:
-                count = self.rng.randint(1, 2)
-                return [self.generate_valid_target(depth + 1) for _ in range(count) if self.consume_energy()]
-            count = self.rng.randint(0, 2)
-            exprs = []
-            for _ in range(count):
-                expr = self.generate_expr(depth + 1)
-                if expr is not None:
-                    exprs.append(expr)
-            return exprs
-        elif field_type == 'stmt':
-            return self.generate_stmt(depth + 1)
-        elif field_type == 'stmt*':
-            count = self.rng.randint(1, 3)
-            stmts = []
-            for _ in range(count):
-                stmt = self.generate_stmt(depth + 1)
-                if stmt is not None:
-                    stmts.append(stmt)
-            return stmts if stmts else [ast.Pass()]
-        elif field_type == 'operator':
-            return self.generate_operator()
-        elif field_type == 'operator*':
-            count = self.rng.randint(1, 2)
-            return [self.generate_operator() for _ in range(count) if self.consume_energy()]
-        elif field_type == 'boolop':
-            return self.generate_boolop()
-        elif field_type == 'unaryop':
-            return self.generate_unaryop()
-        elif field_type == 'cmpop*':
-            count = self.rng.randint(1, 2)
-            return [self.generate_cmpop() for _ in range(count) if self.consume_energy()]
-        elif field_type == 'expr_context':
-            return self.generate_expr_context()
-        elif field_type == 'arg*':
-            count = self.rng.randint(0, 2)
-            args = []
-            for _ in range(count):
-                arg = self.generate_arg(depth + 1)
-                if arg:
-                    args.append(arg)
-            return args
-        elif field_type == 'arg?':
-            return None if self.rng.random() < 0.7 else self.generate_arg(depth + 1)
-        elif field_type == 'arguments':
-            return self.generate_arguments(depth + 1)
-        elif field_type == 'alias*':
-            count = self.rng.randint(1, 2)
-            aliases = []
-            for _ in range(count):
-                alias = self.generate_alias(depth + 1)
-                if alias:
-                    aliases.append(alias)
-            return aliases
-        elif field_type == 'excepthandler*':
-            count = self.rng.randint(1, 2)
-            return [self.generate_excepthandler(depth + 1) for _ in range(count) if self.consume_energy()]
-        elif field_type == 'withitem*':
+    def _field_optional_identifier(self, depth: int, field_name: str) -> Optional[str]:
+        return None if self.rng.random() < 0.5 else self.generate_identifier()
+
+    def _field_identifier_list(self, depth: int, field_name: str) -> List[str]:
+        count = self.rng.randint(1, 2)
+        ids = []
+        for _ in range(count):
+            id_val = self.generate_identifier()
+            if id_val:
+                ids.append(id_val)
+        return ids
+
+    def _field_int(self, depth: int, field_name: str) -> int:
+        return self.rng.randint(0, 10)
+
+    def _field_constant(self, depth: int, field_name: str) -> Any:
+        return self.generate_constant()
+
+    def _field_expr(self, depth: int, field_name: str) -> Optional[ast.expr]:
+        # Special case for assignment/loop targets
+        if field_name in ('target', 'targets'):
+            return self.generate_valid_target(depth)
+        return self.generate_expr(depth + 1)
+
+    def _field_optional_expr(self, depth: int, field_name: str) -> Optional[ast.expr]:
+        return None if self.rng.random() < 0.5 else self.generate_expr(depth + 1)
+
+    def _field_expr_list(self, depth: int, field_name: str) -> List[ast.expr]:
+        # Special case for assignment/delete targets
+        if field_name == 'targets':
             count = self.rng.randint(1, 2)
-            return [self.generate_withitem(depth + 1) for _ in range(count) if self.consume_energy()]
-        elif field_type == 'comprehension*':
-            comp = self.generate_comprehension(depth + 1)
-            return [comp] if comp else []
-        else:
-            return None
+            return [self.generate_valid_target(depth + 1) for _ in range(self.consume_energy_up_to(count))]
+        count = self.rng.randint(0, 2)
+        exprs = []
+        for _ in range(count):
+            expr = self.generate_expr(depth + 1)
+            if expr is not None:
+                exprs.append(expr)
+        return exprs
+
+    def _field_stmt(self, depth: int, field_name: str) -> Optional[ast.stmt]:
+        return self.generate_stmt(depth + 1)
+
+    def _field_stmt_list(self, depth: int, field_name: str) -> List[ast.stmt]:
+        count = self.rng.randint(1, 3)
+        stmts = []
+        for _ in range(count):
+            stmt = self.generate_stmt(depth + 1)
+            if stmt is not None:
+                stmts.append(stmt)
+        return stmts if stmts else [ast.Pass()]
+
+    def _field_operator(self, depth: int, field_name: str) -> ast.operator:
+        return self.generate_operator()
+
+    def _field_operator_list(self, depth: int, field_name: str) -> List[ast.operator]:
+        count = self.rng.randint(1, 2)
+        return [self.generate_operator() for _ in range(self.consume_energy_up_to(count))]
+
+    def _field_boolop(self, depth: int, field_name: str) -> ast.boolop:
+        return self.generate_boolop()
+
+    def _field_unaryop(self, depth: int, field_name: str) -> ast.unaryop:
+        return self.generate_unaryop()
+
+    def _field_cmpop_list(self, depth: int, field_name: str) -> List[ast.cmpop]:
+        count = self.rng.randint(1, 2)
+        return [self.generate_cmpop() for _ in range(self.consume_energy_up_to(count))]
+
+    def _field_expr_context(self, depth: int, field_name: str) -> ast.expr_context:
+        return self.generate_expr_context()
+
+    def _field_arg_list(self, depth: int, field_name: str) -> List[ast.arg]:
+        count = self.rng.randint(0, 2)
+        args = []
+        for _ in range(count):
+            arg = self.generate_arg(depth + 1)
+            if arg:
+                args.append(arg)
+        return args
+
+    def _field_optional_arg(self, depth: int, field_name: str) -> Optional[ast.arg]:
+        return None if self.rng.random() < 0.7 else self.generate_arg(depth + 1)
+
+    def _field_arguments(self, depth: int, field_name: str) -> ast.arguments:
+        return self.generate_arguments(depth + 1)
+
+    def _field_alias_list(self, depth: int, field_name: str) -> List[ast.alias]:
+        count = self.rng.randint(1, 2)
+        aliases = []
+        for _ in range(count):
+            alias = self.generate_alias(depth + 1)
+            if alias:
+                aliases.append(alias)
+        return aliases
+
+    def _field_excepthandler_list(self, depth: int, field_name: str) -> List[ast.ExceptHandler]:
+        count = self.rng.randint(1, 2)
+        return [self.generate_excepthandler(depth + 1) for _ in range(self.consume_energy_up_to(count))]
+
+    def _field_withitem_list(self, depth: int, field_name: str) -> List[ast.withitem]:
+        count = self.rng.randint(1, 2)
+        return [self.generate_withitem(depth + 1) for _ in range(self.consume_energy_up_to(count))]
+
+    def _field_comprehension_list(self, depth: int, field_name: str) -> List[ast.comprehension]:
+        comp = self.generate_comprehension(depth + 1)
+        return [comp] if comp else []
+
+    def _leaf_expr(self, depth: int, field_name: str) -> ast.expr:
+        return self.generate_simple_node('expr')
+
+    def _leaf_stmt(self, depth: int, field_name: str) -> ast.stmt:
+        return self.generate_simple_node('stmt')
+
+    def _leaf_list(self, depth: int, field_name: str) -> list:
+        return []
+
+    # Field type -> generator, looked up once instead of walking an elif
+    # chain of string comparisons for every field
+    _field_generators = {
+        'identifier': _field_identifier,
+        'identifier?': _field_optional_identifier,
+        'identifier*': _field_identifier_list,
+        'int': _field_int,
+        'constant': _field_constant,
+        'string': _field_identifier,
+        'string?': _field_optional_identifier,
+        'expr': _field_expr,
+        'expr?': _field_optional_expr,
+        'expr*': _field_expr_list,
+        'stmt': _field_stmt,
+        'stmt*': _field_stmt_list,
+        'operator': _field_operator,
+        'operator*': _field_operator_list,
+        'boolop': _field_boolop,
+        'unaryop': _field_unaryop,
+        'cmpop*': _field_cmpop_list,
+        'expr_context': _field_expr_context,
+        'arg*': _field_arg_list,
+        'arg?': _field_optional_arg,
+        'arguments': _field_arguments,
+        'alias*': _field_alias_list,
+        'excepthandler*': _field_excepthandler_list,
+        'withitem*': _field_withitem_list,
+        'comprehension*': _field_comprehension_list,
+    }
+
+    # Same lookup at max depth: scalars as usual, simplest nodes, empty lists.
+    # Optional fields and the remaining node types are absent and become None.
+    _leaf_field_generators = {
+        'identifier': _field_identifier,
+        'identifier?': _field_optional_identifier,
+        'identifier*': _leaf_list,
+        'int': _field_int,
+        'constant': _field_constant,
+        'string': _field_identifier,
+        'string?': _field_optional_identifier,
+        'expr': _leaf_expr,
+        'expr*': _leaf_list,
+        'stmt': _leaf_stmt,
+        'stmt*': _leaf_list,
+        'operator*': _leaf_list,
+        'cmpop*': _leaf_list,
+        'arg*': _leaf_list,
+        'alias*': _leaf_list,
+        'excepthandler*': _leaf_list,
+        'withitem*': _leaf_list,
+        'comprehension*': _leaf_list,
+    }
 
     def generate_simple_node(self, node_type: str) -> ast.AST:
         """Generate simplest possible node of given type."""
@@ -445,11 +540,13 @@ class ASTGenerator:
 
     def generate_expr(self, depth: int = 0) -> Optional[ast.expr]:
         """Generate a random expression node with support for composition and chaining."""
-        if not self.consume_energy():
-            return None
-        if depth >= self.max_depth or not self.expr_nodes:
+        # Forced leaves are checked first: only the constant itself is charged
+        if depth >= self.max_depth or not EXPR_NODES:
             const_val = self.generate_constant()
             return ast.Constant(value=const_val) if const_val is not None else ast.Constant(value=42)
+        if self.energy <= 0:
+            return None
+        self.energy -= 1
 
         # Small chance to generate function composition or method chaining (only at low depth)
         if depth < 2 and self.rng.random() < 0.15:  # 15% chance
@@ -466,14 +563,12 @@ class ASTGenerator:
 
         # Prefer simpler expressions at higher depths
         if depth > 1:
-            simple_exprs = ['Constant', 'Name']
-            available = [n for n in simple_exprs if n in self.expr_nodes]
-            if available:
-                node_name = self.rng.choice(available)
+            if SIMPLE_EXPR_NODES:
+                node_name = self.rng.choice(SIMPLE_EXPR_NODES)
             else:
-                node_name = self.rng.choice(self.expr_nodes)
+                node_name = self.rng.choice(EXPR_NODES)
         else:
-            node_name = self.rng.choice(self.expr_nodes)
+            node_name = self.rng.choice(EXPR_NODES)
 
         return self.generate_node(node_name, depth)
 
@@ -573,59 +668,54 @@ class ASTGenerator:
 
     def generate_stmt(self, depth: int = 0) -> Optional[ast.stmt]:
         """Generate a random statement node."""
-        if not self.consume_energy():
-            return None
-        if depth >= self.max_depth or not self.stmt_nodes:
+        # Forced leaves are checked first and cost no energy
+        if depth >= self.max_depth or not STMT_NODES:
             return ast.Pass()
+        if self.energy <= 0:
+            return None
+        self.energy -= 1
 
         # Prefer simpler statements at higher depths
         if depth > 1:
             # At higher depths, strongly prefer simple statements
-            simple_stmts = ['Pass', 'Expr']
-            available = [n for n in simple_stmts if n in self.stmt_nodes]
-            if available and self.rng.random() < 0.7:  # 70% chance to use simple stmt
-                node_name = self.rng.choice(available)
+            if SIMPLE_STMT_NODES and self.rng.random() < 0.7:  # 70% chance to use simple stmt
+                node_name = self.rng.choice(SIMPLE_STMT_NODES)
             else:
-                node_name = self.rng.choice(self.stmt_nodes)
+                node_name = self.rng.choice(STMT_NODES)
         else:
-            node_name = self.rng.choice(self.stmt_nodes)
+            node_name = self.rng.choice(STMT_NODES)
 
         return self.generate_node(node_name, depth)
 
     def generate_operator(self) -> ast.operator:
         """Generate a random operator."""
-        if not self.operator_nodes:
+        if not OPERATOR_CLASSES:
             return ast.Add()
-        node_name = self.rng.choice(self.operator_nodes)
-        return getattr(ast, node_name)()
+        return self.rng.choice(OPERATOR_CLASSES)()
 
     def generate_boolop(self) -> ast.boolop:
         """Generate a random boolean operator."""
-        if not self.boolop_nodes:
+        if not BOOLOP_CLASSES:
             return ast.And()
-        node_name = self.rng.choice(self.boolop_nodes)
-        return getattr(ast, node_name)()
+        return self.rng.choice(BOOLOP_CLASSES)()
 
     def generate_unaryop(self) -> ast.unaryop:
         """Generate a random unary operator."""
-        if not self.unaryop_nodes:
+        if not UNARYOP_CLASSES:
             return ast.Not()
-        node_name = self.rng.choice(self.unaryop_nodes)
-        return getattr(ast, node_name)()
+        return self.rng.choice(UNARYOP_CLASSES)()
 
     def generate_cmpop(self) -> ast.cmpop:
         """Generate a random comparison operator."""
-        if not self.cmpop_nodes:
+        if not CMPOP_CLASSES:
             return ast.Eq()
-        node_name = self.rng.choice(self.cmpop_nodes)
-        return getattr(ast, node_name)()
+        return self.rng.choice(CMPOP_CLASSES)()
 
     def generate_expr_context(self) -> ast.expr_context:
         """Generate a random expression context."""
-        if not self.expr_context_nodes:
+        if not EXPR_CONTEXT_CLASSES:
             return ast.Load()
-        node_name = self.rng.choice(self.expr_context_nodes)
-        return getattr(ast, node_name)()
+        return self.rng.choice(EXPR_CONTEXT_CLASSES)()
 
     def generate_arg(self, depth: int) -> ast.arg:
         """Generate a function argument."""
@@ -682,8 +772,9 @@ class ASTGenerator:
 
     def generate_node(self, node_name: str, depth: int) -> Optional[ast.AST]:
         """Generate a specific AST node by name."""
-        if not self.consume_energy():
+        if self.energy <= 0:
             return None
+        self.energy -= 1
 
         # Special handling for nodes with ordering constraints
         if node_name == 'Try':
@@ -693,152 +784,78 @@ class ASTGenerator:
 
         if node_name not in self.usable_nodes:
             # Fallback to simple node
-            if node_name in self.expr_nodes or depth >= self.max_depth:
+            if node_name in EXPR_NODES or depth >= self.max_depth:
                 return ast.Constant(value=42)
             else:
                 return ast.Pass()
 
-        node_class = getattr(ast, node_name)
-        field_types = self.usable_nodes[node_name]
-
-        # Generate values for all fields
-        kwargs = {}
-        for field_name, field_type in field_types.items():
-            kwargs[field_name] = self.generate_field_value(field_type, depth, field_name)
-
-        try:
-            return node_class(**kwargs)
-        except Exception:
-            # On failure, return simple fallback
-            if node_name in self.expr_nodes:
+        node = NODE_BUILDERS[node_name](self, depth)
+        if node is None:
+            # Construction failed, return simple fallback
+            if node_name in EXPR_NODES:
                 return ast.Constant(value=42)
             else:
                 return ast.Pass()
+        return node
 
     def generate_try(self, depth: int) -> Optional[ast.Try]:
-        """Generate a Try node with properly ordered except handlers."""
-        if not self.consume_energy():
-            return None
+        """Generate a Try node with 1-3 except handlers."""
+        return self._generate_try_like(ast.Try, depth, 3)
 
-        # Generate body
-        body = []
-        num_stmts = self.rng.randint(1, 2)
-        for _ in range(num_stmts):
-            stmt = self.generate_stmt(depth + 1)
-            if stmt:
-                body.append(stmt)
-        if not body:
-            body = [ast.Pass()]
-
-        # Generate exception handlers (1-3)
-        # Ensure bare except (type=None) comes last
-        num_handlers = self.rng.randint(1, 3)
-        handlers = []
-
-        # First generate handlers with types
-        for i in range(num_handlers - 1):
-            if self.consume_energy():
-                exc_type = self.generate_expr(depth + 1) if self.rng.random() < 0.7 else None
-                handler = ast.ExceptHandler(
-                    type=exc_type,
-                    name=None,
-                    body=[ast.Pass()]
-                )
-                handlers.append(handler)
-
-        # Last handler - might be bare
-        if self.consume_energy():
-            # 30% chance for bare except as last handler
-            exc_type = None if self.rng.random() < 0.3 else self.generate_expr(depth + 1)
-            handler = ast.ExceptHandler(
-                type=exc_type,
-                name=None,
-                body=[ast.Pass()]
-            )
-            handlers.append(handler)
-
-        if not handlers:
-            handlers = [ast.ExceptHandler(type=None, name=None, body=[ast.Pass()])]
-
-        # Generate orelse and finalbody
-        orelse = []
-        if self.rng.random() < 0.3:
-            orelse_stmt = self.generate_stmt(depth + 1)
-            if orelse_stmt:
-                orelse.append(orelse_stmt)
-
-        finalbody = []
-        if self.rng.random() < 0.3:
-            final_stmt = self.generate_stmt(depth + 1)
-            if final_stmt:
-                finalbody.append(final_stmt)
+    def generate_try_star(self, depth: int) -> Optional[ast.TryStar]:
+        """Generate a TryStar node with 1-2 except handlers."""
+        return self._generate_try_like(ast.TryStar, depth, 2)
 
-        return ast.Try(
-            body=body,
-            handlers=handlers,
-            orelse=orelse,
-            finalbody=finalbody
-        )
+    def _generate_try_like(self, cls: type, depth: int, max_handlers: int) -> Optional[ast.stmt]:
+        """
+        Generate a Try or TryStar node with properly ordered except handlers.
 
-    def generate_try_star(self, depth: int) -> Optional[ast.TryStar]:
-        """Generate a TryStar node with properly ordered except handlers."""
+        Up to max_handlers handlers are generated; only the last may be bare.
+        """
         if not self.consume_energy():
             return None
 
         # Generate body
-        body = []
-        num_stmts = self.rng.randint(1, 2)
-        for _ in range(num_stmts):
-            stmt = self.generate_stmt(depth + 1)
-            if stmt:
-                body.append(stmt)
-        if not body:
-            body = [ast.Pass()]
+        body = [self.generate_stmt(depth + 1) for _ in range(self.rng.randint(1, 2))]
+        body = [stmt for stmt in body if stmt] or [ast.Pass()]
 
-        # Generate exception handlers (1-2)
+        # Generate exception handlers (1-max_handlers), filled in by index;
+        # slots left as None ran out of energy
         # Ensure bare except (type=None) comes last
-        num_handlers = self.rng.randint(1, 2)
-        handlers = []
+        num_handlers = self.rng.randint(1, max_handlers)
+        handlers = [None] * num_handlers
 
         # First generate handlers with types
         for i in range(num_handlers - 1):
             if self.consume_energy():
                 exc_type = self.generate_expr(depth + 1) if self.rng.random() < 0.7 else None
-                handler = ast.ExceptHandler(
+                handlers[i] = ast.ExceptHandler(
                     type=exc_type,
                     name=None,
                     body=[ast.Pass()]
                 )
-                handlers.append(handler)
 
         # Last handler - might be bare
         if self.consume_energy():
             # 30% chance for bare except as last handler
             exc_type = None if self.rng.random() < 0.3 else self.generate_expr(depth + 1)
-            handler = ast.ExceptHandler(
+            handlers[-1] = ast.ExceptHandler(
                 type=exc_type,
                 name=None,
                 body=[ast.Pass()]
             )
-            handlers.append(handler)
 
-        if not handlers:
-            handlers = [ast.ExceptHandler(type=None, name=None, body=[ast.Pass()])]
+        handlers = ([handler for handler in handlers if handler is not None]
+                    or [ast.ExceptHandler(type=None, name=None, body=[ast.Pass()])])
 
-        # Generate orelse and finalbody
-        orelse = []
-        if self.rng.random() < 0.3:
-            orelse_stmt = self.generate_stmt(depth + 1)
-            if orelse_stmt:
-                orelse.append(orelse_stmt)
+        # Generate orelse and finalbody (at most one statement each)
+        orelse_stmt = self.generate_stmt(depth + 1) if self.rng.random() < 0.3 else None
+        orelse = [orelse_stmt] if orelse_stmt else []
 
-        finalbody = []
-        if self.rng.random() < 0.3:
-            final_stmt = self.generate_stmt(depth + 1)
-            if final_stmt:
-                finalbody.append(final_stmt)
+        final_stmt = self.generate_stmt(depth + 1) if self.rng.random() < 0.3 else None
+        finalbody = [final_stmt] if final_stmt else []
 
-        return ast.TryStar(
+        return cls(
             body=body,
             handlers=handlers,
             orelse=orelse,
@@ -853,40 +870,42 @@ class ASTGenerator:
         - One or more import statements (Import or ImportFrom)
         - At most one FunctionDef or AsyncFunctionDef (possibly with decorators)
         """
-        if not self.consume_energy():
+        if self.energy <= 0:
             return None
+        self.energy -= 1
 
         body = []
 
         # Generate 1-3 import statements
         num_imports = self.rng.randint(1, 3)
         for _ in range(num_imports):
-            if not self.consume_energy():
+            if self.energy <= 0:
                 break
+            self.energy -= 1
             # Choose between Import and ImportFrom
-            if self.rng.random() < 0.5 and 'Import' in self.usable_nodes:
+            if self.rng.random() < 0.5 and _HAS_IMPORT:
                 import_stmt = self.generate_node('Import', 0)
                 if import_stmt:
                     body.append(import_stmt)
-            elif 'ImportFrom' in self.usable_nodes:
+            elif _HAS_IMPORT_FROM:
                 import_stmt = self.generate_node('ImportFrom', 0)
                 if import_stmt:
                     body.append(import_stmt)
 
         # Optionally generate one FunctionDef or AsyncFunctionDef
         if self.rng.random() < 0.8:  # 80% chance to include a function
-            if self.rng.random() < 0.5 and 'FunctionDef' in self.usable_nodes:
+            if self.rng.random() < 0.5 and _HAS_FUNCTION_DEF:
                 func = self.generate_function_def(0)
                 if func:
                     body.append(func)
-            elif 'AsyncFunctionDef' in self.usable_nodes:
+            elif _HAS_ASYNC_FUNCTION_DEF:
                 func = self.generate_async_function_def(0)
                 if func:
                     body.append(func)
 
         # Ensure we have at least one import
         if not body:
-            if 'Import' in self.usable_nodes:
+            if _HAS_IMPORT:
                 import_stmt = self.generate_node('Import', 0)
                 if import_stmt:
                     body.append(import_stmt)
@@ -897,8 +916,9 @@ class ASTGenerator:
 
     def generate_function_def(self, depth: int) -> Optional[ast.FunctionDef]:
         """Generate a FunctionDef node, possibly with decorators."""
-        if not self.consume_energy():
+        if self.energy <= 0:
             return None
+        self.energy -= 1
 
         name = self.generate_identifier()
         if not name:
@@ -927,19 +947,14 @@ class ASTGenerator:
                 if decorator:
                     decorator_list.append(decorator)
 
-        return ast.FunctionDef(
-            name=name,
-            args=args,
-            body=body_stmts,
-            decorator_list=decorator_list,
-            returns=None,
-            type_comment=None
-        )
+        # Positional: name, args, body, decorator_list, returns, type_comment
+        return ast.FunctionDef(name, args, body_stmts, decorator_list, None, None)
 
     def generate_async_function_def(self, depth: int) -> Optional[ast.AsyncFunctionDef]:
         """Generate an AsyncFunctionDef node, possibly with decorators."""
-        if not self.consume_energy():
+        if self.energy <= 0:
             return None
+        self.energy -= 1
 
         name = self.generate_identifier()
         if not name:
@@ -968,28 +983,73 @@ class ASTGenerator:
                 if decorator:
                     decorator_list.append(decorator)
 
-        return ast.AsyncFunctionDef(
-            name=name,
-            args=args,
-            body=body_stmts,
-            decorator_list=decorator_list,
-            returns=None,
-            type_comment=None
-        )
+        # Positional: name, args, body, decorator_list, returns, type_comment
+        return ast.AsyncFunctionDef(name, args, body_stmts, decorator_list, None, None)
 
 
-def generate(seed: int, energy: Optional[int] = None) -> Optional[str]:
+def _make_node_builder(node_class: type, field_items: Tuple[Tuple[str, str], ...]):
     """
-    Generate a random AST module and return its unparsed code.
+    Specialize generate_node() for one node class.
 
-    Args:
-        seed: Random seed for deterministic generation
-        energy: Energy budget for generation (decrements for each AST node/scalar).
-                Returns None if energy reaches 0 during generation.
-                Default: 1000
+    The field generators for both depth regimes are resolved once here, so the
+    returned builder(generator, depth) only charges energy and calls them; it
+    returns None if the node class rejects the generated fields.
+    """
+    fields = tuple(
+        (field_name,
+         ASTGenerator._field_generators.get(field_type),
+         ASTGenerator._leaf_field_generators.get(field_type))
+        for field_name, field_type in field_items
+    )
+
+    def build(generator: ASTGenerator, depth: int) -> Optional[ast.AST]:
+        # Each field costs one energy; past max_depth the leaf generators are used
+        leaf = depth >= generator.max_depth
+        kwargs = {}
+        for field_name, field_generator, leaf_generator in fields:
+            if generator.energy <= 0:
+                kwargs[field_name] = None
+                continue
+            generator.energy -= 1
+            field_generator = leaf_generator if leaf else field_generator
+            kwargs[field_name] = None if field_generator is None else field_generator(generator, depth, field_name)
+        try:
+            return node_class(**kwargs)
+        except Exception:
+            return None
+
+    return build
+
+
+# Node name -> specialized builder, see _make_node_builder()
+NODE_BUILDERS = {
+    node_name: _make_node_builder(node_class, field_items)
+    for node_name, (node_class, field_items) in get_node_specs().items()
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _import_skeleton(names: Tuple[str, ...]) -> Optional[str]:
+    """
+    Code for a module made of a single `import a, b` statement, or None if a
+    name is a keyword (e.g. `import if`), which compile() would reject.
+
+    Many generated modules are only this fallback import, so their code is
+    produced without ast.unparse() and compile(). Only the code string is
+    cached: the module it describes is still built fresh by ASTGenerator.
+    """
+    if any(keyword.iskeyword(name) for name in names):
+        return None
+    return 'import ' + ', '.join(names)
+
+
+def _generate_module_and_code(seed: int, energy: Optional[int] = None,
+                              validate: bool = True) -> Optional[Tuple[ast.Module, str]]:
+    """
+    Generate a random AST module and, if validate is true, compile its unparsed code.
 
     Returns:
-        Unparsed Python code string, or None if generation fails or energy exhausted
+        (module, code) tuple, or None if generation fails or energy exhausted
     """
     try:
         generator = ASTGenerator(seed, energy=energy)
@@ -998,11 +1058,23 @@ def generate(seed: int, energy: Optional[int] = None) -> Optional[str]:
             return None
         # Fix missing location information
         ast.fix_missing_locations(module)
+        # Fast path for the import-only fallback module, see _import_skeleton()
+        body = module.body
+        if len(body) == 1 and type(body[0]) is ast.Import:
+            names = tuple(alias.name for alias in body[0].names if alias.asname is None)
+            if len(names) == len(body[0].names):
+                code = _import_skeleton(names)
+                if code is not None:
+                    return module, code
+                if validate:
+                    return None
         code = ast.unparse(module)
+        if not validate:
+            return module, code
         # Validate the generated code by trying to parse it
         try:
             compile(code, '<generated>', 'exec')
-            return code
+            return module, code
         except SyntaxError:
             # Generated code has syntax errors, return None
             return None
@@ -1010,13 +1082,113 @@ def generate(seed: int, energy: Optional[int] = None) -> Optional[str]:
         return None
 
 
-def generate_field_type_mapping() -> str:
+def generate(seed: int, energy: Optional[int] = None, validate: bool = True) -> Optional[str]:
     """
-    Generate the FIELD TYPE MAPPING section.
+    Generate a random AST module and return its unparsed code.
+
+    Args:
+        seed: Random seed for deterministic generation
+        energy: Energy budget for generation (decrements for each AST node/scalar).
+                Returns None if energy reaches 0 during generation.
+                Default: 1000
+        validate: Compile the unparsed code and return None on SyntaxError.
+                  The generator does not guarantee valid code (about a third
+                  of seeds are rejected), so only pass False when the caller
+                  compiles or executes the code itself and handles errors.
 
     Returns:
-        Formatted string documenting all node field types.
+        Unparsed Python code string, or None if generation fails or energy exhausted
+    """
+    return _generate_cached(seed, energy, validate)
+
+
+@functools.lru_cache(maxsize=4096)
+def _generate_cached(seed: int, energy: Optional[int], validate: bool) -> Optional[str]:
     """
+    Memoized body of generate(), keyed on (seed, energy, validate).
+
+    Generation is a pure function of its arguments, so fuzz drivers that
+    revisit a seed skip the rebuild, unparse and compile. Only the code string
+    is cached. Every node of a generate_tree() result is built for that call
+    and shared with no other tree, so mutating the tree cannot change what
+    generate() returns later.
+    """
+    result = _generate_module_and_code(seed, energy, validate)
+    return None if result is None else result[1]
+
+
+def generate_tree(seed: int, energy: Optional[int] = None, validate: bool = True) -> Optional[ast.Module]:
+    """
+    Generate a random AST module and return the tree itself.
+
+    Same seeds, energy and validation as generate(), for callers that work on
+    the AST and would otherwise re-parse the unparsed code.
+
+    Returns:
+        ast.Module, or None if generation fails or energy exhausted
+    """
+    result = _generate_module_and_code(seed, energy, validate)
+    return None if result is None else result[0]
+
+
+def _seed_and_tree(seed: int, energy: Optional[int] = None) -> Tuple[int, Optional[ast.Module]]:
+    """Worker for generate_batch(): pair a seed with its generate_tree() result."""
+    return seed, generate_tree(seed, energy)
+
+
+def _seed_and_code(seed: int, energy: Optional[int] = None) -> Tuple[int, Optional[str]]:
+    """Worker for generate_many(): pair a seed with its generate() result."""
+    return seed, generate(seed, energy)
+
+
+def _map_seeds(worker, seeds: Iterable[int], jobs: Optional[int], chunksize: int) -> Iterator:
+    """
+    Apply worker to each seed, in order, using jobs processes.
+
+    Seeds are independent, so with jobs > 1 (default: os.cpu_count()) the work
+    is spread over a process pool whose workers inherit the module-level node
+    tables; with jobs == 1 it runs in this process.
+    """
+    jobs = jobs if jobs is not None else (os.cpu_count() or 1)
+    if jobs <= 1:
+        yield from map(worker, seeds)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(worker, seeds, chunksize=chunksize)
+
+
+def generate_batch(seeds: Iterable[int], energy: Optional[int] = None, jobs: Optional[int] = None,
+                   chunksize: int = 16) -> Iterator[Tuple[int, Optional[ast.Module]]]:
+    """
+    Generate one AST module per seed, spread over a process pool.
+
+    Yields:
+        (seed, module) pairs in seed order; module is None where generate_tree()
+        would return None
+    """
+    worker = functools.partial(_seed_and_tree, energy=energy)
+    yield from _map_seeds(worker, seeds, jobs, chunksize)
+
+
+def generate_many(seeds: Iterable[int], energy: Optional[int] = None, jobs: Optional[int] = None,
+                  chunksize: int = 64) -> Iterator[Tuple[int, Optional[str]]]:
+    """
+    Generate the code for many seeds, spread over a process pool.
+
+    Only code strings cross the process boundary, which is cheaper than the
+    trees of generate_batch(); hence the larger default chunksize.
+
+    Yields:
+        (seed, code) pairs in seed order; code is None where generate() would
+        return None
+    """
+    worker = functools.partial(_seed_and_code, energy=energy)
+    yield from _map_seeds(worker, seeds, jobs, chunksize)
+
+
+def _format_field_type_mapping() -> str:
+    """Format the FIELD TYPE MAPPING section from introspect_ast_nodes()."""
     field_types = introspect_ast_nodes()
 
     output = []
@@ -1032,6 +1204,20 @@ def generate_field_type_mapping() -> str:
     return '\n'.join(output)
 
 
+# The mapping only depends on the ast module, so it is formatted once
+_FIELD_TYPE_MAPPING_STR = _format_field_type_mapping()
+
+
+def generate_field_type_mapping() -> str:
+    """
+    Generate the FIELD TYPE MAPPING section.
+
+    Returns:
+        Formatted string documenting all node field types.
+    """
+    return _FIELD_TYPE_MAPPING_STR
+
+
 if __name__ == '__main__':
     import argparse
 
@@ -1039,12 +1225,13 @@ if __name__ == '__main__':
     parser.add_argument('--seed', type=int, help='Random seed for deterministic generation')
     parser.add_argument('--energy', type=int, help='Energy budget for generation (default: 1000)')
     parser.add_argument('--mapping', action='store_true', help='Print field type mapping instead of generating code')
+    parser.add_argument('--no-validate', action='store_true', help='Print the code without checking that it compiles')
     args = parser.parse_args()
 
     if args.mapping:
         print(generate_field_type_mapping())
     elif args.seed is not None:
-        code = generate(args.seed, energy=args.energy)
+        code = generate(args.seed, energy=args.energy, validate=not args.no_validate)
         if code is None:
             print("Error: Failed to generate valid AST code", file=sys.stderr)
             sys.exit(1)
@@ -0,0 +1,34 @@
+"""
+Tests for the random AST generator in tests/code/code.py.
+
+Checks that the process-pool helpers return the same results, in the same
+order, as generating each seed in this process.
+"""
+import ast
+
+import pytest
+
+from tests.code.code import generate, generate_batch, generate_many, generate_tree
+
+
+SEEDS = [42, 7, 666, 0, 2001, 13]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_generate_batch_matches_generate_tree(jobs):
+    """Test that generate_batch yields (seed, tree) pairs in seed order, equal to generate_tree"""
+    result = list(generate_batch(SEEDS, jobs=jobs, chunksize=2))
+
+    assert [seed for seed, _ in result] == SEEDS
+    expected = [generate_tree(seed) for seed in SEEDS]
+    assert [tree if tree is None else ast.dump(tree) for _, tree in result] == \
+        [tree if tree is None else ast.dump(tree) for tree in expected]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_generate_many_matches_generate(jobs):
+    """Test that generate_many yields (seed, code) pairs in seed order, equal to generate"""
+    result = list(generate_many(SEEDS, jobs=jobs, chunksize=2))
+
+    assert [seed for seed, _ in result] == SEEDS
+    assert [code for _, code in result] == [generate(seed) for seed in SEEDS]
@@ -4,53 +4,47 @@ Tests for the commit command.
 Integration tests for CLI validation and functionality.
 """
 import json
+import shutil
 import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 
 import bb
-from tests.conftest import normalize_code_for_test
+from tests.conftest import HASH_PATTERN, CLIRunner, normalize_code_for_test
 
 
-# Helper to run CLI commands
-def cli_run(args: list, env: dict = None, cwd: str = None) -> subprocess.CompletedProcess:
-    """Run bb.py CLI command."""
-    cmd = [sys.executable, str(Path(__file__).parent.parent.parent / 'bb.py')] + args
-    return subprocess.run(cmd, capture_output=True, text=True, env=env, cwd=cwd)
+def _extract_hash(stdout: str) -> str:
+    """Return the hash from the "Hash: <hash>" line printed by add, or None."""
+    match = HASH_PATTERN.search(stdout)
+    return match.group(1) if match else None
 
 
 # =============================================================================
 # Integration tests for commit CLI validation
 # =============================================================================
 
-def test_commit_invalid_hash_format_fails(tmp_path):
+def test_commit_invalid_hash_format_fails(session_cli_runner):
     """Test that commit fails with invalid hash format"""
-    bb_dir = tmp_path / '.bb'
-    env = {'BB_DIRECTORY': str(bb_dir)}
-
-    result = cli_run(['commit', 'not-a-valid-hash', '--comment', 'test'], env=env)
+    result = session_cli_runner.run(['commit', 'not-a-valid-hash', '--comment', 'test'])
 
     assert result.returncode != 0
     assert 'Invalid hash format' in result.stderr
 
 
-def test_commit_nonexistent_function_fails(tmp_path):
+def test_commit_nonexistent_function_fails(session_cli_runner):
     """Test that commit fails for nonexistent function"""
-    bb_dir = tmp_path / '.bb'
-    env = {'BB_DIRECTORY': str(bb_dir)}
     fake_hash = 'f' * 64
 
-    result = cli_run(['commit', fake_hash, '--comment', 'test'], env=env)
+    result = session_cli_runner.run(['commit', fake_hash, '--comment', 'test'])
 
     assert result.returncode != 0
     assert 'not found' in result.stderr.lower()
 
 
-def test_commit_help_shows_usage():
+def test_commit_help_shows_usage(session_cli_runner):
     """Test that commit --help shows usage information"""
-    result = cli_run(['commit', '--help'])
+    result = session_cli_runner.run(['commit', '--help'])
 
     assert result.returncode == 0
     assert 'hash' in result.stdout.lower()
@@ -61,12 +55,9 @@ def test_commit_help_shows_usage():
 # Integration tests for commit functionality
 # =============================================================================
 
-def test_commit_copies_function_to_git_directory(tmp_path):
+def test_commit_copies_function_to_git_directory(tmp_path, cli_runner):
     """Test that commit copies function to git directory"""
-    bb_dir = tmp_path / '.bb'
-    pool_dir = bb_dir / 'pool'
-    pool_dir.mkdir(parents=True, exist_ok=True)
-    env = {'BB_DIRECTORY': str(bb_dir)}
+    bb_dir = cli_runner.bb_dir
 
     # Create a test file and add it
     test_file = tmp_path / 'test_func.py'
@@ -76,19 +67,15 @@ def test_commit_copies_function_to_git_directory(tmp_path):
 ''', encoding='utf-8')
 
     # Add function to pool
-    add_result = cli_run(['add', f'{test_file}@eng'], env=env)
+    add_result = cli_runner.run(['add', f'{test_file}@eng'])
     assert add_result.returncode == 0
 
     # Extract hash from output
-    func_hash = None
-    for line in add_result.stdout.split('\n'):
-        if 'Hash:' in line:
-            func_hash = line.split('Hash:')[1].strip()
-            break
+    func_hash = _extract_hash(add_result.stdout)
     assert func_hash is not None
 
     # Commit the function
-    result = cli_run(['commit', func_hash, '--comment', 'Add hello function'], env=env)
+    result = cli_runner.run(['commit', func_hash, '--comment', 'Add hello function'])
 
     assert result.returncode == 0
     assert 'Committed' in result.stdout
@@ -100,12 +87,9 @@ def test_commit_copies_function_to_git_directory(tmp_path):
     assert func_in_git.exists()
 
 
-def test_commit_copies_all_language_mappings(tmp_path):
+def test_commit_copies_all_language_mappings(tmp_path, cli_runner):
     """Test that commit copies all language mappings"""
-    bb_dir = tmp_path / '.bb'
-    pool_dir = bb_dir / 'pool'
-    pool_dir.mkdir(parents=True, exist_ok=True)
-    env = {'BB_DIRECTORY': str(bb_dir)}
+    bb_dir = cli_runner.bb_dir
 
     # Create English version
     test_file_eng = tmp_path / 'hello_eng.py'
@@ -122,19 +106,15 @@ def test_commit_copies_all_language_mappings(tmp_path):
 ''', encoding='utf-8')
 
     # Add both versions
-    add_eng = cli_run(['add', f'{test_file_eng}@eng'], env=env)
+    add_eng = cli_runner.run(['add', f'{test_file_eng}@eng'])
     assert add_eng.returncode == 0
-    func_hash = None
-    for line in add_eng.stdout.split('\n'):
-        if 'Hash:' in line:
-            func_hash = line.split('Hash:')[1].strip()
-            break
+    func_hash = _extract_hash(add_eng.stdout)
 
-    add_fra = cli_run(['add', f'{test_file_fra}@fra'], env=env)
+    add_fra = cli_runner.run(['add', f'{test_file_fra}@fra'])
     assert add_fra.returncode == 0
 
     # Commit the function
-    result = cli_run(['commit', func_hash, '--comment', 'Add multilingual hello'], env=env)
+    result = cli_runner.run(['commit', func_hash, '--comment', 'Add multilingual hello'])
     assert result.returncode == 0
 
     # Verify both language mappings were copied
@@ -144,12 +124,9 @@ def test_commit_copies_all_language_mappings(tmp_path):
     assert (func_git_dir / 'fra').exists()
 
 
-def test_commit_copies_dependencies_recursively(tmp_path):
+def test_commit_copies_dependencies_recursively(tmp_path, cli_runner):
     """Test that commit copies all dependencies recursively"""
-    bb_dir = tmp_path / '.bb'
-    pool_dir = bb_dir / 'pool'
-    pool_dir.mkdir(parents=True, exist_ok=True)
-    env = {'BB_DIRECTORY': str(bb_dir)}
+    bb_dir = cli_runner.bb_dir
 
     # Create helper function
     helper_file = tmp_path / 'helper.py'
@@ -159,13 +136,9 @@ def test_commit_copies_dependencies_recursively(tmp_path):
 ''', encoding='utf-8')
 
     # Add helper
-    add_helper = cli_run(['add', f'{helper_file}@eng'], env=env)
+    add_helper = cli_runner.run(['add', f'{helper_file}@eng'])
     assert add_helper.returncode == 0
-    helper_hash = None
-    for line in add_helper.stdout.split('\n'):
-        if 'Hash:' in line:
-            helper_hash = line.split('Hash:')[1].strip()
-            break
+    helper_hash = _extract_hash(add_helper.stdout)
 
     # Create main function that depends on helper
     main_file = tmp_path / 'main.py'
@@ -177,16 +150,12 @@ def main():
 ''', encoding='utf-8')
 
     # Add main
-    add_main = cli_run(['add', f'{main_file}@eng'], env=env)
+    add_main = cli_runner.run(['add', f'{main_file}@eng'])
     assert add_main.returncode == 0
-    main_hash = None
-    for line in add_main.stdout.split('\n'):
-        if 'Hash:' in line:
-            main_hash = line.split('Hash:')[1].strip()
-            break
+    main_hash = _extract_hash(add_main.stdout)
 
     # Commit the main function
-    result = cli_run(['commit', main_hash, '--comment', 'Add main with dependency'], env=env)
+    result = cli_runner.run(['commit', main_hash, '--comment', 'Add main with dependency'])
     assert result.returncode == 0
     assert '2 function(s)' in result.stdout  # main + helper
 
@@ -198,12 +167,9 @@ def main():
     assert helper_in_git.exists()
 
 
-def test_commit_initializes_git_repo(tmp_path):
+def test_commit_initializes_git_repo(tmp_path, cli_runner):
     """Test that commit initializes git repository if not present"""
-    bb_dir = tmp_path / '.bb'
-    pool_dir = bb_dir / 'pool'
-    pool_dir.mkdir(parents=True, exist_ok=True)
-    env = {'BB_DIRECTORY': str(bb_dir)}
+    bb_dir = cli_runner.bb_dir
 
     # Create and add a function
     test_file = tmp_path / 'test.py'
@@ -212,15 +178,12 @@ def test_commit_initializes_git_repo(tmp_path):
     return 1
 ''', encoding='utf-8')
 
-    add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = None
-    for line in add_result.stdout.split('\n'):
-        if 'Hash:' in line:
-            func_hash = line.split('Hash:')[1].strip()
-            break
+    add_result = cli_runner.run(['add', f'{test_file}@eng'])
+    func_hash = _extract_hash(add_result.stdout)
 
-    # Commit
-    result = cli_run(['commit', func_hash, '--comment', 'Initial commit'], env=env)
+    # Commit in a real interpreter: git init must run with the environment a
+    # user's bb.py process would pass down, not the test runner's
+    result = CLIRunner(bb_dir, in_process=False).run(['commit', func_hash, '--comment', 'Initial commit'])
     assert result.returncode == 0
 
     # Verify git was initialized
@@ -228,31 +191,32 @@ def test_commit_initializes_git_repo(tmp_path):
     assert (git_dir / '.git').exists()
 
 
-def test_commit_creates_git_commit(tmp_path):
-    """Test that commit creates an actual git commit"""
-    bb_dir = tmp_path / '.bb'
-    pool_dir = bb_dir / 'pool'
-    pool_dir.mkdir(parents=True, exist_ok=True)
-    env = {'BB_DIRECTORY': str(bb_dir)}
+@pytest.fixture(scope='module')
+def committed_bb(tmp_path_factory):
+    """bb directory where test() was added and committed once for this module
 
-    # Create and add a function
-    test_file = tmp_path / 'test.py'
+    Returns (bb_dir, func_hash, comment). The git repository under bb_dir/git
+    is shared: copy the directory before running commands that may write to it.
+    """
+    module_dir = tmp_path_factory.mktemp('committed')
+    test_file = module_dir / 'test.py'
     test_file.write_text('''def test():
     """Test function"""
     return 1
 ''', encoding='utf-8')
 
-    add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = None
-    for line in add_result.stdout.split('\n'):
-        if 'Hash:' in line:
-            func_hash = line.split('Hash:')[1].strip()
-            break
+    runner = CLIRunner(module_dir / '.bb')
+    runner.pool_dir.mkdir(parents=True)
+    func_hash = runner.add(str(test_file), 'eng')
+    comment = 'Test commit message'
+    result = runner.run(['commit', func_hash, '--comment', comment])
+    assert result.returncode == 0, result.stderr
+    return runner.bb_dir, func_hash, comment
 
-    # Commit with specific message
-    commit_msg = 'Test commit message'
-    result = cli_run(['commit', func_hash, '--comment', commit_msg], env=env)
-    assert result.returncode == 0
+
+def test_commit_creates_git_commit(committed_bb):
+    """Test that commit creates an actual git commit"""
+    bb_dir, _, commit_msg = committed_bb
 
     # Verify git log shows the commit
     git_dir = bb_dir / 'git'
@@ -265,32 +229,14 @@ def test_commit_creates_git_commit(tmp_path):
     assert commit_msg in git_log.stdout
 
 
-def test_commit_no_changes_when_already_committed(tmp_path):
+def test_commit_no_changes_when_already_committed(cli_runner, committed_bb):
     """Test that commit reports no changes when function already committed"""
-    bb_dir = tmp_path / '.bb'
-    pool_dir = bb_dir / 'pool'
-    pool_dir.mkdir(parents=True, exist_ok=True)
-    env = {'BB_DIRECTORY': str(bb_dir)}
-
-    # Create and add a function
-    test_file = tmp_path / 'test.py'
-    test_file.write_text('''def test():
-    """Test function"""
-    return 1
-''', encoding='utf-8')
-
-    add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = None
-    for line in add_result.stdout.split('\n'):
-        if 'Hash:' in line:
-            func_hash = line.split('Hash:')[1].strip()
-            break
-
-    # First commit
-    cli_run(['commit', func_hash, '--comment', 'First commit'], env=env)
+    # Private copy of the committed directory: a second commit may touch git
+    bb_dir, func_hash, _ = committed_bb
+    shutil.copytree(bb_dir, cli_runner.bb_dir, dirs_exist_ok=True)
 
     # Second commit of same function
-    result = cli_run(['commit', func_hash, '--comment', 'Second commit'], env=env)
+    result = cli_runner.run(['commit', func_hash, '--comment', 'Second commit'])
     assert result.returncode == 0
     assert 'No new changes to commit' in result.stdout
 
@@ -299,21 +245,12 @@ def test_commit_no_changes_when_already_committed(tmp_path):
 # Unit tests for commit helper functions
 # =============================================================================
 
-def test_storage_get_git_directory():
+def test_storage_get_git_directory(monkeypatch):
     """Test that storage_get_git_directory returns correct path"""
-    import os
-
     # Test with BB_DIRECTORY set
-    original = os.environ.get('BB_DIRECTORY')
-    try:
-        os.environ['BB_DIRECTORY'] = '/test/bb'
-        result = bb.storage_get_git_directory()
-        assert result == Path('/test/bb/git')
-    finally:
-        if original:
-            os.environ['BB_DIRECTORY'] = original
-        elif 'BB_DIRECTORY' in os.environ:
-            del os.environ['BB_DIRECTORY']
+    monkeypatch.setenv('BB_DIRECTORY', '/test/bb')
+    result = bb.storage_get_git_directory()
+    assert result == Path('/test/bb/git')
 
 
 def test_git_init_commit_repo_creates_directory(tmp_path, monkeypatch):
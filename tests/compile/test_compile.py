@@ -14,27 +14,27 @@ from tests.conftest import normalize_code_for_test
 # Integration tests for compile CLI command
 # =============================================================================
 
-def test_compile_debug_without_language_fails(cli_runner):
+def test_compile_debug_without_language_fails(session_cli_runner):
     """Test that compile --debug fails without language suffix"""
-    result = cli_runner.run(['compile', '--debug', 'a' * 64])
+    result = session_cli_runner.run(['compile', '--debug', 'a' * 64])
 
     assert result.returncode != 0
     assert '--debug requires language suffix' in result.stderr
 
 
-def test_compile_invalid_hash_format_fails(cli_runner):
+def test_compile_invalid_hash_format_fails(session_cli_runner):
     """Test that compile fails with invalid hash format"""
-    result = cli_runner.run(['compile', 'not-a-valid-hash@eng'])
+    result = session_cli_runner.run(['compile', 'not-a-valid-hash@eng'])
 
     assert result.returncode != 0
     assert 'Invalid hash format' in result.stderr
 
 
-def test_compile_nonexistent_function_fails(cli_runner):
+def test_compile_nonexistent_function_fails(session_cli_runner):
     """Test that compile fails for nonexistent function"""
     fake_hash = "f" * 64
 
-    result = cli_runner.run(['compile', f'{fake_hash}@eng'])
+    result = session_cli_runner.run(['compile', f'{fake_hash}@eng'])
 
     assert result.returncode != 0
 
@@ -55,9 +55,9 @@ def test_compile_prepares_bundle(cli_runner, tmp_path):
     assert result.returncode != 0
 
 
-def test_compile_too_short_language_code_fails(cli_runner):
+def test_compile_too_short_language_code_fails(session_cli_runner):
     """Test that compile fails with too short language code"""
-    result = cli_runner.run(['compile', 'a' * 64 + '@ab'])
+    result = session_cli_runner.run(['compile', 'a' * 64 + '@ab'])
 
     assert result.returncode != 0
     assert 'Language code must be 3-256 characters' in result.stderr
@@ -78,6 +78,16 @@ def _bb_v_0():
     assert deps == []
 
 
+def test_dependencies_extract_ignores_bb_pool_outside_imports():
+    """Test that a mention of bb.pool that is not an import is not a dependency"""
+    code = normalize_code_for_test("""
+def _bb_v_0():
+    return 'from bb.pool import object_abc123'
+""")
+    deps = bb.code_extract_dependencies(code)
+    assert deps == []
+
+
 def test_dependencies_extract_single_dep():
     """Test extracting single dependency"""
     code = normalize_code_for_test("""
@@ -314,10 +324,8 @@ def test_compile_generate_runtime(tmp_path):
 # Tests for --python mode
 # =============================================================================
 
-def test_compile_python_mode_creates_file(cli_runner, tmp_path):
+def test_compile_python_mode_creates_file(cli_runner, tmp_path, monkeypatch):
     """Test that compile --python creates a main.py file"""
-    import os
-
     # Setup: Add a simple function
     test_file = tmp_path / "simple.py"
     test_file.write_text('''def greet(name):
@@ -328,12 +336,8 @@ def test_compile_python_mode_creates_file(cli_runner, tmp_path):
 
     # Test: Run compile with --python
     # Change to tmp_path so main.py is created there
-    original_cwd = os.getcwd()
-    os.chdir(tmp_path)
-    try:
-        result = cli_runner.run(['compile', '--python', f'{func_hash}@eng'])
-    finally:
-        os.chdir(original_cwd)
+    monkeypatch.chdir(tmp_path)
+    result = cli_runner.run(['compile', '--python', f'{func_hash}@eng'])
 
     # Assert: Should succeed and create main.py
     assert result.returncode == 0
@@ -349,9 +353,8 @@ def test_compile_python_mode_creates_file(cli_runner, tmp_path):
     assert 'if __name__ == "__main__":' in content
 
 
-def test_compile_python_mode_executable(cli_runner, tmp_path):
+def test_compile_python_mode_executable(cli_runner, tmp_path, monkeypatch):
     """Test that compiled Python file is executable"""
-    import os
     import subprocess
     import sys
 
@@ -364,12 +367,8 @@ def test_compile_python_mode_executable(cli_runner, tmp_path):
     func_hash = cli_runner.add(str(test_file), 'eng')
 
     # Compile with --python
-    original_cwd = os.getcwd()
-    os.chdir(tmp_path)
-    try:
-        result = cli_runner.run(['compile', '--python', f'{func_hash}@eng'])
-    finally:
-        os.chdir(original_cwd)
+    monkeypatch.chdir(tmp_path)
+    result = cli_runner.run(['compile', '--python', f'{func_hash}@eng'])
 
     assert result.returncode == 0
 
@@ -9,11 +9,24 @@ Test Philosophy:
 - Test: Call CLI commands
 - Assert: Check CLI output and/or files directly
 - Unit tests only for complex low-level aspects (AST, hashing, schema, migration)
+
+CLIRunner runs commands in-process through bb.main(); set BB_TEST_SUBPROCESS=1
+to run each command in a fresh interpreter instead.
 """
 import ast
+import contextlib
+import functools
+import io
+import json
+import locale
+import os
+import re
+import shutil
 import subprocess
 import sys
+import traceback
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -23,11 +36,27 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import bb
 
 # Export fixtures and helpers
-__all__ = ['normalize_code_for_test', 'mock_bb_dir', 'sample_function_code',
+__all__ = ['HASH_PATTERN', 'CLIRunner', 'normalize_code_for_test', 'code_normalize_for_test', 'parse_code_for_test', 'mock_bb_dir', 'sample_function_code',
            'sample_function_file', 'sample_async_function_code', 'sample_async_function_file',
-           'cli_run', 'cli_runner']
+           'cli_run', 'cli_run_in_process', 'cli_runner', 'session_cli_runner',
+           'helper_pool', 'helper_hash', 'pool_link', 'load_json',
+           'EXAMPLES_DIR', 'example_files']
+
+
+# Matches the "Hash: <hash>" line printed when a function is saved
+HASH_PATTERN = re.compile(r'Hash: ([0-9a-f]{64})')
+
+# Repository examples/ directory (example_simple.py, example_simple_french.py, ...)
+EXAMPLES_DIR = Path(__file__).parent.parent / 'examples'
+
+# Interpreter and script prefix for cli_run, resolved once per session.
+# -I -S -B: isolated mode, skip site.py and do not write bytecode, bb.py
+# only needs the standard library so interpreter startup can stay minimal
+_BB_PY = str(Path(__file__).parent.parent / 'bb.py')
+_BB_COMMAND = (sys.executable, '-I', '-S', '-B', _BB_PY)
 
 
+@functools.lru_cache(maxsize=256)
 def normalize_code_for_test(code: str) -> str:
     """
     Normalize code string to match ast.unparse() output format.
@@ -50,6 +79,9 @@ def normalize_code_for_test(code: str) -> str:
         # Correct - use this helper:
         normalized_code = normalize_code_for_test("def _bb_v_0(): return 42")
         # Returns: "def _bb_v_0():\\n    return 42"
+
+    Results are memoized: the output is a pure function of the source text and
+    several tests normalize the same snippets.
     """
     tree = ast.parse(code)
     bb.code_clear_locations(tree)
@@ -57,6 +89,62 @@ def normalize_code_for_test(code: str) -> str:
     return ast.unparse(tree)
 
 
+def code_normalize_for_test(code: str, lang: str):
+    """
+    Parse code and run bb.code_normalize on it, once per (code, lang).
+
+    Returns the same (code_with_docstring, code_without_docstring, docstring,
+    name_mapping, alias_mapping) tuple as bb.code_normalize. The normalization
+    is cached and shared between tests; the two mappings are copied on every
+    call, so callers may modify them freely.
+    """
+    with_doc, without_doc, docstring, name_mapping, alias_mapping = _code_normalize_cached(code, lang)
+    return with_doc, without_doc, docstring, dict(name_mapping), dict(alias_mapping)
+
+
+@functools.lru_cache(maxsize=256)
+def _code_normalize_cached(code: str, lang: str):
+    """Cached normalization behind code_normalize_for_test(); the result must not be mutated"""
+    return bb.code_normalize(parse_code_for_test(code, fresh=True), lang)
+
+
+def load_json(path) -> Any:
+    """Read and parse a JSON file (object.json, mapping.json, config.json) in one call."""
+    return json.loads(Path(path).read_bytes())
+
+
+class LazyTextProcess(subprocess.CompletedProcess):
+    """
+    CompletedProcess holding captured bytes that decodes stdout and stderr on
+    first access, the same way text=True would, and caches the text.
+    """
+
+    @staticmethod
+    def _decode(value):
+        if isinstance(value, bytes):
+            value = value.decode(locale.getpreferredencoding(False))
+            value = value.replace('\r\n', '\n').replace('\r', '\n')
+        return value
+
+    @property
+    def stdout(self):
+        self._stdout = self._decode(self._stdout)
+        return self._stdout
+
+    @stdout.setter
+    def stdout(self, value):
+        self._stdout = value
+
+    @property
+    def stderr(self):
+        self._stderr = self._decode(self._stderr)
+        return self._stderr
+
+    @stderr.setter
+    def stderr(self, value):
+        self._stderr = value
+
+
 def cli_run(args: list, env: dict = None, cwd: str = None) -> subprocess.CompletedProcess:
     """
     Run bb.py CLI command.
@@ -74,21 +162,77 @@ def cli_run(args: list, env: dict = None, cwd: str = None) -> subprocess.Complet
         assert result.returncode == 0
         assert 'Hash:' in result.stdout
     """
-    import os
-
-    cmd = [sys.executable, str(Path(__file__).parent.parent / 'bb.py')] + args
+    cmd = [*_BB_COMMAND, *args]
 
-    run_env = os.environ.copy()
-    if env:
-        run_env.update(env)
+    # Without extra variables the child simply inherits os.environ
+    run_env = {**os.environ, **env} if env else None
 
-    return subprocess.run(
+    # Capture bytes: many tests only look at returncode, so stdout and stderr
+    # are decoded by LazyTextProcess the first time they are read
+    result = subprocess.run(
         cmd,
         capture_output=True,
-        text=True,
         env=run_env,
         cwd=cwd
     )
+    return LazyTextProcess(result.args, result.returncode, result.stdout, result.stderr)
+
+
+def cli_run_in_process(args: list, env: dict = None, cwd: str = None) -> subprocess.CompletedProcess:
+    """
+    Run bb.py CLI command by calling bb.main() in the test process.
+
+    Same contract as cli_run, without paying for an interpreter start-up:
+    env and cwd are applied for the duration of the call, stdout and stderr
+    are captured, and SystemExit is turned into a return code. Uncaught
+    exceptions print their traceback to stderr and return 1, like the
+    interpreter would.
+    """
+    env = env or {}
+    saved_env = {key: os.environ.get(key) for key in env}
+    saved_cwd = os.getcwd() if cwd else None
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+
+    os.environ.update(env)
+    if cwd:
+        os.chdir(cwd)
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                bb.main(args)
+            except SystemExit as e:
+                if e.code is None:
+                    returncode = 0
+                elif isinstance(e.code, int):
+                    returncode = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+            except Exception:
+                traceback.print_exc()
+                returncode = 1
+    finally:
+        if saved_cwd:
+            os.chdir(saved_cwd)
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+    return subprocess.CompletedProcess(args, returncode, stdout.getvalue(), stderr.getvalue())
+
+
+def pool_link(source: Path, destination: Path) -> None:
+    """
+    Populate destination with hard links to every file of the source pool.
+
+    Much cheaper than adding the same functions again, but the files are
+    shared: only use this for tests that read the pool. A test that could
+    rewrite an existing object.json or mapping.json must copy instead.
+    """
+    shutil.copytree(source, destination, copy_function=os.link, dirs_exist_ok=True)
 
 
 class CLIRunner:
@@ -100,8 +244,13 @@ class CLIRunner:
         └── config.json    # Configuration file
     """
 
-    def __init__(self, bb_dir: Path):
+    def __init__(self, bb_dir: Path, in_process: bool = None):
         self.bb_dir = bb_dir
+        # Commands run in-process unless BB_TEST_SUBPROCESS=1 is set or the
+        # test asks for a real interpreter with in_process=False
+        if in_process is None:
+            in_process = os.environ.get('BB_TEST_SUBPROCESS') != '1'
+        self.in_process = in_process
         self.pool_dir = bb_dir / 'pool'
         self.env = {
             'BB_DIRECTORY': str(bb_dir)
@@ -109,6 +258,8 @@ class CLIRunner:
 
     def run(self, args: list, cwd: str = None) -> subprocess.CompletedProcess:
         """Run CLI command with this runner's bb directory."""
+        if self.in_process:
+            return cli_run_in_process(args, env=self.env, cwd=cwd)
         return cli_run(args, env=self.env, cwd=cwd)
 
     def add(self, file_path: str, lang: str) -> str:
@@ -117,10 +268,10 @@ class CLIRunner:
         if result.returncode != 0:
             raise RuntimeError(f"add failed: {result.stderr}")
         # Extract hash from output
-        for line in result.stdout.split('\n'):
-            if 'Hash:' in line:
-                return line.split('Hash:')[1].strip()
-        raise RuntimeError(f"Could not find hash in output: {result.stdout}")
+        match = HASH_PATTERN.search(result.stdout)
+        if match is None:
+            raise RuntimeError(f"Could not find hash in output: {result.stdout}")
+        return match.group(1)
 
     def show(self, hash_lang: str) -> str:
         """Show a function and return its code."""
@@ -137,6 +288,40 @@ class CLIRunner:
         return result.stdout
 
 
+def parse_code_for_test(code: str, fresh: bool = False) -> ast.Module:
+    """
+    Parse code straight through the C parser, like ast.parse does.
+
+    By default the tree is parsed once per unique snippet and shared between
+    callers: only use it for tests that read the AST (name collection,
+    definition extraction, name mapping). Anything that transforms the tree in
+    place, such as code_normalize or ASTNormalizer, must pass fresh=True to
+    get its own copy.
+    """
+    if fresh:
+        return compile(code, '<test>', 'exec', flags=ast.PyCF_ONLY_AST)
+    return _parse_code_cached(code)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_code_cached(code: str) -> ast.Module:
+    """Cached parse behind parse_code_for_test()"""
+    return parse_code_for_test(code, fresh=True)
+
+
+def pytest_configure(config):
+    """
+    Put pytest's temporary directories on tmpfs when /dev/shm is available.
+
+    Every add writes object.json and mapping.json under tmp_path, so keeping the
+    pools in RAM avoids disk I/O. An explicit PYTEST_DEBUG_TEMPROOT or
+    --basetemp still wins.
+    """
+    shm = '/dev/shm'
+    if os.path.isdir(shm) and os.access(shm, os.W_OK | os.X_OK):
+        os.environ.setdefault('PYTEST_DEBUG_TEMPROOT', shm)
+
+
 @pytest.fixture
 def mock_bb_dir(tmp_path, monkeypatch):
     """
@@ -181,6 +366,67 @@ def cli_runner(tmp_path):
     return CLIRunner(bb_dir)
 
 
+@pytest.fixture(scope='session')
+def session_cli_runner(tmp_path_factory):
+    """
+    Fixture providing a CLIRunner whose bb directory is created once per session.
+
+    Only use this for tests that never write to the pool, such as argument
+    validation failures and lookups of nonexistent functions; everything else
+    should use the isolated cli_runner fixture.
+    """
+    bb_dir = tmp_path_factory.mktemp('session') / '.bb'
+    (bb_dir / 'pool').mkdir(parents=True)
+
+    return CLIRunner(bb_dir)
+
+
+@pytest.fixture(scope='session')
+def helper_pool(tmp_path_factory):
+    """
+    Fixture providing a pool with a single helper(x) function, added once per session.
+
+    Returns (pool_dir, helper_hash). Tests should not write to this pool; use
+    the helper_hash fixture to get a private copy instead.
+    """
+    session_dir = tmp_path_factory.mktemp('helper')
+    helper_file = session_dir / 'helper.py'
+    helper_file.write_text('''def helper(x):
+    """Helper function"""
+    return x * 2
+''')
+
+    runner = CLIRunner(session_dir / '.bb')
+    runner.pool_dir.mkdir(parents=True)
+    return runner.pool_dir, runner.add(str(helper_file), 'eng')
+
+
+@pytest.fixture
+def helper_hash(cli_runner, helper_pool):
+    """
+    Fixture copying the session helper(x) function into cli_runner's pool.
+
+    Returns the helper hash, ready to be imported with
+    'from bb.pool import object_<hash> as helper'.
+    """
+    pool_dir, func_hash = helper_pool
+    shutil.copytree(pool_dir, cli_runner.pool_dir, dirs_exist_ok=True)
+    return func_hash
+
+
+@pytest.fixture(scope='session')
+def example_files():
+    """
+    Fixture providing the source of the English and French simple examples.
+
+    Returns a dict mapping language code to source text, read once per session.
+    """
+    return {
+        'eng': (EXAMPLES_DIR / 'example_simple.py').read_text(encoding='utf-8'),
+        'fra': (EXAMPLES_DIR / 'example_simple_french.py').read_text(encoding='utf-8'),
+    }
+
+
 @pytest.fixture
 def sample_function_code():
     """Sample function code for testing."""
@@ -8,6 +8,9 @@ Grey-box style:
 
 Note: 'get' and 'show' are functionally equivalent for single-mapping functions.
 """
+import pytest
+
+from tests.conftest import CLIRunner, pool_link
 
 
 def test_get_returns_denormalized_code(cli_runner, tmp_path):
@@ -54,22 +57,33 @@ def load_config(filepath):
     assert 'from pathlib import Path' in result.stdout
 
 
-def test_get_multilingual_english(cli_runner, tmp_path):
-    """Test get retrieves correct language version - English"""
-    # Setup
-    eng_file = tmp_path / "eng.py"
+@pytest.fixture(scope='module')
+def greet_pool(tmp_path_factory):
+    """Pool with greet() in English and French, added once for this module"""
+    module_dir = tmp_path_factory.mktemp('greet')
+    eng_file = module_dir / "eng.py"
     eng_file.write_text('''def greet(name):
     """Greet someone in English"""
     return f"Hello, {name}!"
 ''')
-    fra_file = tmp_path / "fra.py"
+    fra_file = module_dir / "fra.py"
     fra_file.write_text('''def greet(name):
     """Saluer quelqu'un en français"""
     return f"Hello, {name}!"
 ''')
 
-    func_hash = cli_runner.add(str(eng_file), 'eng')
-    cli_runner.add(str(fra_file), 'fra')
+    runner = CLIRunner(module_dir / '.bb')
+    runner.pool_dir.mkdir(parents=True)
+    func_hash = runner.add(str(eng_file), 'eng')
+    runner.add(str(fra_file), 'fra')
+    return runner.pool_dir, func_hash
+
+
+def test_get_multilingual_english(cli_runner, greet_pool):
+    """Test get retrieves correct language version - English"""
+    # Setup
+    pool_dir, func_hash = greet_pool
+    pool_link(pool_dir, cli_runner.pool_dir)
 
     # Test
     result = cli_runner.run(['get', f'{func_hash}@eng'])
@@ -79,22 +93,11 @@ def test_get_multilingual_english(cli_runner, tmp_path):
     assert 'Greet someone in English' in result.stdout
 
 
-def test_get_multilingual_french(cli_runner, tmp_path):
+def test_get_multilingual_french(cli_runner, greet_pool):
     """Test get retrieves correct language version - French"""
     # Setup
-    eng_file = tmp_path / "eng.py"
-    eng_file.write_text('''def greet(name):
-    """Greet someone in English"""
-    return f"Hello, {name}!"
-''')
-    fra_file = tmp_path / "fra.py"
-    fra_file.write_text('''def greet(name):
-    """Saluer quelqu'un en français"""
-    return f"Hello, {name}!"
-''')
-
-    func_hash = cli_runner.add(str(eng_file), 'eng')
-    cli_runner.add(str(fra_file), 'fra')
+    pool_dir, func_hash = greet_pool
+    pool_link(pool_dir, cli_runner.pool_dir)
 
     # Test
     result = cli_runner.run(['get', f'{func_hash}@fra'])
@@ -104,34 +107,18 @@ def test_get_multilingual_french(cli_runner, tmp_path):
     assert 'Saluer' in result.stdout
 
 
-def test_get_missing_language_suffix_fails(cli_runner, tmp_path):
-    """Test that get fails without language suffix"""
-    # Setup
-    test_file = tmp_path / "test.py"
-    test_file.write_text('def foo(): pass')
-    func_hash = cli_runner.add(str(test_file), 'eng')
-
-    # Test
-    result = cli_runner.run(['get', func_hash])
-
-    # Assert
-    assert result.returncode != 0
-
-
-def test_get_invalid_hash_fails(cli_runner):
-    """Test that get fails with invalid hash format"""
-    result = cli_runner.run(['get', 'not-a-valid-hash@eng'])
-
-    assert result.returncode != 0
-
-
-def test_get_nonexistent_function_fails(cli_runner):
-    """Test that get fails for nonexistent function"""
-    fake_hash = "f" * 64
-
-    result = cli_runner.run(['get', f'{fake_hash}@eng'])
+@pytest.mark.parametrize("arg, error", [
+    ("f" * 64, "Missing language suffix"),
+    ("f" * 64 + "@en", "Language code must be 3-256 characters"),
+    ("not-a-valid-hash@eng", "Invalid hash format"),
+    ("f" * 64 + "@eng", "Function not found"),
+])
+def test_get_bad_argument_fails(session_cli_runner, arg, error):
+    """Test that get fails without language suffix, with an invalid hash, or for a nonexistent function"""
+    result = session_cli_runner.run(['get', arg])
 
     assert result.returncode != 0
+    assert error in result.stderr
 
 
 def test_get_nonexistent_language_fails(cli_runner, tmp_path):
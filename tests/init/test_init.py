@@ -11,14 +11,14 @@ from pathlib import Path
 
 import pytest
 
+from tests.conftest import load_json
+
 
 def cli_run(args: list, env: dict = None, cwd: str = None) -> subprocess.CompletedProcess:
     """Run bb.py CLI command."""
     cmd = [sys.executable, str(Path(__file__).parent.parent.parent / 'bb.py')] + args
 
-    run_env = os.environ.copy()
-    if env:
-        run_env.update(env)
+    run_env = {**os.environ, **env} if env else None
 
     return subprocess.run(
         cmd,
@@ -52,7 +52,7 @@ def test_init_creates_config_file(tmp_path):
     config_path = bb_dir / 'config.json'
     assert config_path.exists()
 
-    config = json.loads(config_path.read_text())
+    config = load_json(config_path)
     assert 'user' in config
     assert 'remotes' in config
     assert 'username' in config['user']
@@ -71,7 +71,7 @@ def test_init_uses_username_from_environment(tmp_path, monkeypatch):
     result = cli_run(['init'], env=env)
 
     assert result.returncode == 0
-    config = json.loads((bb_dir / 'config.json').read_text())
+    config = load_json(bb_dir / 'config.json')
     assert config['user']['username'] == 'testuser123'
 
 
@@ -104,7 +104,7 @@ def test_init_existing_config_not_overwritten(tmp_path):
     assert 'already exists' in result.stdout
 
     # Verify original config is preserved
-    preserved_config = json.loads(config_path.read_text())
+    preserved_config = load_json(config_path)
     assert preserved_config['user']['username'] == 'existing_user'
     assert preserved_config['user']['custom'] == 'value'
 
@@ -119,14 +119,14 @@ def test_init_idempotent(tmp_path):
     assert result1.returncode == 0
 
     # Get config after first init
-    config1 = json.loads((bb_dir / 'config.json').read_text())
+    config1 = load_json(bb_dir / 'config.json')
 
     # Second init
     result2 = cli_run(['init'], env=env)
     assert result2.returncode == 0
 
     # Config should be unchanged
-    config2 = json.loads((bb_dir / 'config.json').read_text())
+    config2 = load_json(bb_dir / 'config.json')
     assert config1 == config2
 
 
@@ -138,7 +138,7 @@ def test_init_creates_empty_remotes(tmp_path):
     result = cli_run(['init'], env=env)
 
     assert result.returncode == 0
-    config = json.loads((bb_dir / 'config.json').read_text())
+    config = load_json(bb_dir / 'config.json')
     assert config['remotes'] == {}
 
 
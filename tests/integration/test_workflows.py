@@ -132,17 +132,9 @@ def analyze(data):
     assert 'def analyze' in result.stdout
 
 
-def test_workflow_function_with_bb_import(cli_runner, tmp_path):
+def test_workflow_function_with_bb_import(cli_runner, tmp_path, helper_hash):
     """Test adding function that imports from bb pool"""
-    # First, add a helper function
-    helper_file = tmp_path / "helper.py"
-    helper_file.write_text('''def helper(x):
-    """A helper function"""
-    return x * 2
-''')
-
-    helper_hash = cli_runner.add(str(helper_file), 'eng')
-
+    # The helper_hash fixture put a helper function in the pool
     # Now add a function that uses the helper
     main_file = tmp_path / "main.py"
     main_file.write_text(f'''from bb.pool import object_{helper_hash} as helper
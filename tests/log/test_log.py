@@ -11,14 +11,14 @@ from pathlib import Path
 
 import pytest
 
+from tests.conftest import HASH_PATTERN
+
 
 def cli_run(args: list, env: dict = None) -> subprocess.CompletedProcess:
     """Run bb.py CLI command."""
     cmd = [sys.executable, str(Path(__file__).parent.parent.parent / 'bb.py')] + args
 
-    run_env = os.environ.copy()
-    if env:
-        run_env.update(env)
+    run_env = {**os.environ, **env} if env else None
 
     return subprocess.run(
         cmd,
@@ -60,7 +60,7 @@ def test_log_displays_function_info(tmp_path):
     test_file = tmp_path / "func.py"
     test_file.write_text('def foo(): pass')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test
     result = cli_run(['log'], env=env)
@@ -10,14 +10,19 @@ from pathlib import Path
 
 import pytest
 
+from tests.conftest import HASH_PATTERN
+
+
+HASH_A = 'a' * 64
+HASH_B = 'b' * 64
+HASH_C = 'c' * 64
+
 
 def cli_run(args: list, env: dict = None) -> subprocess.CompletedProcess:
     """Run bb.py CLI command."""
     cmd = [sys.executable, str(Path(__file__).parent.parent.parent / 'bb.py')] + args
 
-    run_env = os.environ.copy()
-    if env:
-        run_env.update(env)
+    run_env = {**os.environ, **env} if env else None
 
     return subprocess.run(
         cmd,
@@ -32,8 +37,8 @@ def test_refactor_invalid_what_hash_fails(tmp_path):
     bb_dir = tmp_path / '.bb'
     env = {'BB_DIRECTORY': str(bb_dir)}
 
-    fake_from = 'a' * 64
-    fake_to = 'b' * 64
+    fake_from = HASH_A
+    fake_to = HASH_B
     result = cli_run(['refactor', 'invalid-hash', fake_from, fake_to], env=env)
 
     assert result.returncode != 0
@@ -46,8 +51,8 @@ def test_refactor_invalid_from_hash_fails(tmp_path):
     bb_dir = tmp_path / '.bb'
     env = {'BB_DIRECTORY': str(bb_dir)}
 
-    fake_what = 'a' * 64
-    fake_to = 'b' * 64
+    fake_what = HASH_A
+    fake_to = HASH_B
     result = cli_run(['refactor', fake_what, 'invalid', fake_to], env=env)
 
     assert result.returncode != 0
@@ -59,8 +64,8 @@ def test_refactor_invalid_to_hash_fails(tmp_path):
     bb_dir = tmp_path / '.bb'
     env = {'BB_DIRECTORY': str(bb_dir)}
 
-    fake_what = 'a' * 64
-    fake_from = 'b' * 64
+    fake_what = HASH_A
+    fake_from = HASH_B
     result = cli_run(['refactor', fake_what, fake_from, 'invalid'], env=env)
 
     assert result.returncode != 0
@@ -73,9 +78,9 @@ def test_refactor_nonexistent_what_function_fails(tmp_path):
     (bb_dir / 'pool').mkdir(parents=True)
     env = {'BB_DIRECTORY': str(bb_dir)}
 
-    fake_what = 'a' * 64
-    fake_from = 'b' * 64
-    fake_to = 'c' * 64
+    fake_what = HASH_A
+    fake_from = HASH_B
+    fake_to = HASH_C
     result = cli_run(['refactor', fake_what, fake_from, fake_to], env=env)
 
     assert result.returncode != 0
@@ -91,10 +96,10 @@ def test_refactor_nonexistent_to_function_fails(tmp_path):
     test_file = tmp_path / "func.py"
     test_file.write_text('def foo(): return 42')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    what_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    what_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
-    fake_from = 'b' * 64
-    fake_to = 'c' * 64
+    fake_from = HASH_B
+    fake_to = HASH_C
     result = cli_run(['refactor', what_hash, fake_from, fake_to], env=env)
 
     assert result.returncode != 0
@@ -4,7 +4,6 @@ Tests for 'bb.py review' command.
 Grey-box integration tests for function review with dependency resolution.
 Note: review is now interactive, so some tests use stdin injection.
 """
-import json
 import os
 import subprocess
 import sys
@@ -12,14 +11,14 @@ from pathlib import Path
 
 import pytest
 
+from tests.conftest import HASH_PATTERN, load_json
+
 
 def cli_run(args: list, env: dict = None, input_text: str = None) -> subprocess.CompletedProcess:
     """Run bb.py CLI command with optional stdin input."""
     cmd = [sys.executable, str(Path(__file__).parent.parent.parent / 'bb.py')] + args
 
-    run_env = os.environ.copy()
-    if env:
-        run_env.update(env)
+    run_env = {**os.environ, **env} if env else None
 
     return subprocess.run(
         cmd,
@@ -67,7 +66,7 @@ def test_review_displays_function_code(tmp_path):
     return data * 2
 ''')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test - provide 'y' to approve the function
     result = cli_run(['review', func_hash], env=env, input_text='y\n')
@@ -90,7 +89,7 @@ def test_review_shows_function_review_header(tmp_path):
     test_file = tmp_path / "func.py"
     test_file.write_text('def foo(): pass')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test - provide 'y' to approve
     result = cli_run(['review', func_hash], env=env, input_text='y\n')
@@ -116,7 +115,7 @@ def test_review_uses_preferred_language(tmp_path):
     return valeur * 2
 ''')
     add_result = cli_run(['add', f'{test_file}@fra'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test - provide 'y' to approve
     result = cli_run(['review', func_hash], env=env, input_text='y\n')
@@ -140,7 +139,7 @@ def test_review_fallback_when_language_unavailable(tmp_path):
     test_file = tmp_path / "func.py"
     test_file.write_text('def foo(): pass')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test - run will exit early due to no matching language
     result = cli_run(['review', func_hash], env=env, input_text='y\n')
@@ -158,7 +157,7 @@ def test_review_default_language_fallback(tmp_path):
     test_file = tmp_path / "func.py"
     test_file.write_text('def foo(): pass')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test: Review without init (config doesn't exist) - provide 'y'
     result = cli_run(['review', func_hash], env=env, input_text='y\n')
@@ -178,7 +177,7 @@ def test_review_saves_state(tmp_path):
     test_file = tmp_path / "func.py"
     test_file.write_text('def bar(): pass')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test - approve the function
     result = cli_run(['review', func_hash], env=env, input_text='y\n')
@@ -190,8 +189,7 @@ def test_review_saves_state(tmp_path):
     state_file = bb_dir / 'review_state.json'
     assert state_file.exists()
 
-    with open(state_file, 'r') as f:
-        state = json.load(f)
+    state = load_json(state_file)
     assert func_hash in state['reviewed']
 
 
@@ -205,7 +203,7 @@ def test_review_skips_already_reviewed(tmp_path):
     test_file = tmp_path / "func.py"
     test_file.write_text('def baz(): pass')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # First review - approve
     cli_run(['review', func_hash], env=env, input_text='y\n')
@@ -228,7 +226,7 @@ def test_review_quit_saves_progress(tmp_path):
     test_file = tmp_path / "func.py"
     test_file.write_text('def qux(): pass')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test - quit without approving
     result = cli_run(['review', func_hash], env=env, input_text='q\n')
@@ -11,14 +11,14 @@ from pathlib import Path
 
 import pytest
 
+from tests.conftest import HASH_PATTERN
+
 
 def cli_run(args: list, env: dict = None) -> subprocess.CompletedProcess:
     """Run bb.py CLI command."""
     cmd = [sys.executable, str(Path(__file__).parent.parent.parent / 'bb.py')] + args
 
-    run_env = os.environ.copy()
-    if env:
-        run_env.update(env)
+    run_env = {**os.environ, **env} if env else None
 
     return subprocess.run(
         cmd,
@@ -40,7 +40,7 @@ def test_run_without_language_works(tmp_path):
     return f"Hello, {name}!"
 ''')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test: Run without @lang
     result = cli_run(['run', func_hash, '--', 'World'], env=env)
@@ -75,7 +75,7 @@ def test_run_debug_requires_language(tmp_path):
     return f"Hello, {name}!"
 ''')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test: Run --debug without @lang
     result = cli_run(['run', '--debug', func_hash], env=env)
@@ -133,7 +133,7 @@ def test_run_with_string_argument(tmp_path):
     return f"Hello, {name}!"
 ''')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test - arguments are passed as strings, no implicit coercion
     result = cli_run(['run', f'{func_hash}@eng', '--', 'World'], env=env)
@@ -155,7 +155,7 @@ def test_run_with_multiple_string_arguments(tmp_path):
     return a + b
 ''')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test - arguments passed as strings
     result = cli_run(['run', f'{func_hash}@eng', '--', 'Hello', 'World'], env=env)
@@ -177,7 +177,7 @@ def test_run_displays_function_code(tmp_path):
     return value + 1
 ''')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test
     result = cli_run(['run', f'{func_hash}@eng', '--', '10'], env=env)
@@ -200,7 +200,7 @@ def test_run_function_with_exception(tmp_path):
     return a / b
 ''')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test: Division by zero
     result = cli_run(['run', f'{func_hash}@eng', '--', '10', '0'], env=env)
@@ -6,6 +6,7 @@ Grey-box style:
 - Test: Call 'show' command via CLI
 - Assert: Check output contains expected code
 """
+from tests.conftest import HASH_PATTERN
 
 
 def test_show_displays_denormalized_code(cli_runner, tmp_path):
@@ -167,11 +168,11 @@ def test_show_without_language_lists_languages(cli_runner, tmp_path):
     assert '1 mapping(s)' in result.stdout
 
 
-def test_show_nonexistent_function_fails(cli_runner):
+def test_show_nonexistent_function_fails(session_cli_runner):
     """Test that show fails for nonexistent function"""
     fake_hash = "0" * 64
 
-    result = cli_runner.run(['show', f'{fake_hash}@eng'])
+    result = session_cli_runner.run(['show', f'{fake_hash}@eng'])
 
     assert result.returncode != 0
 
@@ -206,7 +207,7 @@ def test_show_multiple_mappings_shows_menu(cli_runner, tmp_path):
     assert result2.returncode == 0
 
     # Extract hash
-    func_hash = result1.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(result1.stdout).group(1)
 
     # Test: Show function with multiple mappings
     result = cli_runner.run(['show', f'{func_hash}@eng'])
@@ -229,7 +230,7 @@ def test_show_explicit_mapping_hash(cli_runner, tmp_path):
 
     # Add with comment
     result1 = cli_runner.run(['add', f'{test_file}@eng', '--comment', 'target version'])
-    func_hash = result1.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(result1.stdout).group(1)
     mapping_hash = result1.stdout.split('Mapping hash:')[1].strip().split()[0]
 
     # Test: Show with explicit mapping hash
@@ -241,9 +242,9 @@ def test_show_explicit_mapping_hash(cli_runner, tmp_path):
     assert 'Test function' in result.stdout
 
 
-def test_show_invalid_hash_format_fails(cli_runner):
+def test_show_invalid_hash_format_fails(session_cli_runner):
     """Test that show fails with invalid hash format"""
-    result = cli_runner.run(['show', 'not-valid-hash@eng'])
+    result = session_cli_runner.run(['show', 'not-valid-hash@eng'])
 
     assert result.returncode != 0
     assert 'Invalid hash format' in result.stderr
@@ -3,12 +3,10 @@ Tests for storage functions (Schema v1 write/read path).
 
 Tests for saving and loading functions in v1 format.
 """
-import json
-
 import pytest
 
 import bb
-from tests.conftest import normalize_code_for_test
+from tests.conftest import normalize_code_for_test, load_json
 
 
 # ============================================================================
@@ -35,8 +33,7 @@ def test_function_save_v1_creates_object_json(mock_bb_dir):
     assert object_json.exists()
 
     # Load and verify structure
-    with open(object_json, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_json(object_json)
 
     assert data['schema_version'] == 1
     assert data['hash'] == test_hash
@@ -56,8 +53,7 @@ def test_function_save_v1_no_language_data(mock_bb_dir):
     func_dir = pool_dir / test_hash[:2] / test_hash[2:]
     object_json = func_dir / 'object.json'
 
-    with open(object_json, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_json(object_json)
 
     # Should NOT have docstrings, name_mappings, alias_mappings
     assert 'docstrings' not in data
@@ -91,8 +87,7 @@ def test_mapping_save_v1_creates_mapping_json(mock_bb_dir):
     assert mapping_json.exists()
 
     # Load and verify structure
-    with open(mapping_json, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_json(mapping_json)
 
     assert data['docstring'] == docstring
     assert data['name_mapping'] == name_mapping
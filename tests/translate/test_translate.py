@@ -12,14 +12,14 @@ from pathlib import Path
 
 import pytest
 
+from tests.conftest import HASH_PATTERN
+
 
 def cli_run(args: list, env: dict = None, input_text: str = None) -> subprocess.CompletedProcess:
     """Run bb.py CLI command with optional stdin input."""
     cmd = [sys.executable, str(Path(__file__).parent.parent.parent / 'bb.py')] + args
 
-    run_env = os.environ.copy()
-    if env:
-        run_env.update(env)
+    run_env = {**os.environ, **env} if env else None
 
     return subprocess.run(
         cmd,
@@ -39,7 +39,7 @@ def test_translate_missing_source_language_fails(tmp_path):
     test_file = tmp_path / "func.py"
     test_file.write_text('def foo(): pass')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test: translate without @lang
     result = cli_run(['translate', func_hash, 'fra'], env=env)
@@ -72,7 +72,7 @@ def test_translate_invalid_target_language_fails(tmp_path):
     test_file = tmp_path / "func.py"
     test_file.write_text('def foo(): pass')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test with too short language code (must be 3-256 chars)
     result = cli_run(['translate', f'{func_hash}@eng', 'ab'], env=env)
@@ -118,7 +118,7 @@ def test_translate_shows_source_function(tmp_path):
     return f"Hello, {name}!"
 ''')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test: Provide interactive input (will fail on empty input but we can check output)
     # Provide translations: function name, variable name, docstring, comment
@@ -142,7 +142,7 @@ def test_translate_creates_mapping(tmp_path):
     return f"Hello, {name}!"
 ''')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test: Provide translations for both names
     # _bb_v_0 = greet, _bb_v_1 = name
@@ -171,7 +171,7 @@ def test_translate_prompts_for_all_names(tmp_path):
     return result
 ''')
     add_result = cli_run(['add', f'{test_file}@eng'], env=env)
-    func_hash = add_result.stdout.split('Hash:')[1].strip().split()[0]
+    func_hash = HASH_PATTERN.search(add_result.stdout).group(1)
 
     # Test: Provide translations for all names
     # 4 names: function + 3 variables
@@ -3,7 +3,6 @@ Tests for 'bb.py whoami' command.
 
 Grey-box integration tests for user configuration management.
 """
-import json
 import os
 import subprocess
 import sys
@@ -11,14 +10,14 @@ from pathlib import Path
 
 import pytest
 
+from tests.conftest import load_json
+
 
 def cli_run(args: list, env: dict = None, cwd: str = None) -> subprocess.CompletedProcess:
     """Run bb.py CLI command."""
     cmd = [sys.executable, str(Path(__file__).parent.parent.parent / 'bb.py')] + args
 
-    run_env = os.environ.copy()
-    if env:
-        run_env.update(env)
+    run_env = {**os.environ, **env} if env else None
 
     return subprocess.run(
         cmd,
@@ -153,7 +152,7 @@ def test_whoami_persists_to_config_file(tmp_path):
     cli_run(['whoami', 'email', 'persisted@example.com'], env=env)
 
     # Read config directly
-    config = json.loads((bb_dir / 'config.json').read_text())
+    config = load_json(bb_dir / 'config.json')
 
     assert config['user']['name'] == 'persisteduser'
     assert config['user']['email'] == 'persisted@example.com'